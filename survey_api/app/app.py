@@ -5,14 +5,31 @@ from flask import Flask
 from flask_cors import CORS
 from werkzeug.middleware.proxy_fix import ProxyFix
 
+from .core.batching import setup_response_batching
+from .core.cache import setup_cache
+from .core.cli import setup_cli
 from .core.cors import setup_cors
 from .core.db import setup_db
 from .core.error import setup_error_handlers
+from .core.sweeper import setup_email_retry_sweeper, setup_expiry_sweeper
+from .core.workers import setup_email_workers
+from .routes.contact_list_contacts_get import contact_list_contacts_get_blueprint
+from .routes.contact_list_contacts_post import contact_list_contacts_post_blueprint
+from .routes.contact_list_delete import contact_list_delete_blueprint
+from .routes.contact_list_post import contact_list_post_blueprint
+from .routes.contact_lists_get import contact_lists_get_blueprint
 from .routes.health import health_blueprint
+from .routes.metrics import metrics_blueprint
 from .routes.survey_delete import survey_delete_blueprint
+from .routes.survey_email_tasks_get import survey_email_tasks_get_blueprint
 from .routes.survey_get import survey_get_blueprint
 from .routes.survey_post import survey_post_blueprint
+from .routes.survey_recipients_get import survey_recipients_get_blueprint
+from .routes.survey_recipients_upload_post import survey_recipients_upload_post_blueprint
+from .routes.survey_respondents_get import survey_respondents_get_blueprint
 from .routes.survey_response_post import survey_response_post_blueprint
+from .routes.survey_responses_bulk_post import survey_responses_bulk_post_blueprint
+from .routes.survey_results_export_get import survey_results_export_get_blueprint
 from .routes.survey_results_get import survey_results_get_blueprint
 from .routes.survey_retry_failed_emails_post import survey_retry_failed_emails_post_blueprint
 from .routes.survey_terminate_post import survey_terminate_post_blueprint
@@ -41,10 +58,22 @@ setup_cors(app)
 
 # Register blueprints
 app.register_blueprint(health_blueprint)
+app.register_blueprint(metrics_blueprint)
+app.register_blueprint(contact_list_contacts_get_blueprint, url_prefix="/api")
+app.register_blueprint(contact_list_contacts_post_blueprint, url_prefix="/api")
+app.register_blueprint(contact_list_delete_blueprint, url_prefix="/api")
+app.register_blueprint(contact_list_post_blueprint, url_prefix="/api")
+app.register_blueprint(contact_lists_get_blueprint, url_prefix="/api")
 app.register_blueprint(survey_delete_blueprint, url_prefix="/api")
+app.register_blueprint(survey_email_tasks_get_blueprint, url_prefix="/api")
 app.register_blueprint(survey_get_blueprint, url_prefix="/api")
 app.register_blueprint(survey_post_blueprint, url_prefix="/api")
+app.register_blueprint(survey_recipients_get_blueprint, url_prefix="/api")
+app.register_blueprint(survey_recipients_upload_post_blueprint, url_prefix="/api")
+app.register_blueprint(survey_respondents_get_blueprint, url_prefix="/api")
 app.register_blueprint(survey_response_post_blueprint, url_prefix="/api")
+app.register_blueprint(survey_responses_bulk_post_blueprint, url_prefix="/api")
+app.register_blueprint(survey_results_export_get_blueprint, url_prefix="/api")
 app.register_blueprint(survey_results_get_blueprint, url_prefix="/api")
 app.register_blueprint(survey_retry_failed_emails_post_blueprint, url_prefix="/api")
 app.register_blueprint(survey_terminate_post_blueprint, url_prefix="/api")
@@ -56,5 +85,23 @@ setup_error_handlers(app)
 # Set up the database
 setup_db(app)
 
+# Set up the in-process caches
+setup_cache(app)
+
+# Coalesce public survey responses into group commits (opt-in)
+setup_response_batching(app)
+
+# Run email jobs on a long-lived bounded worker pool
+setup_email_workers(app)
+
+# Close expired surveys in the background
+setup_expiry_sweeper(app)
+
+# Retry failed email tasks in the background once their backoff has passed
+setup_email_retry_sweeper(app)
+
+# Register CLI commands
+setup_cli(app)
+
 if __name__ == "__main__":
     app.run()
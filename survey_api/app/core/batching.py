@@ -0,0 +1,239 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Optional, Tuple
+
+from flask import Flask
+from pydantic import UUID4
+from sqlalchemy.exc import DBAPIError
+
+from .db import db
+from .survey_service import (
+    SurveyResponseOutcome,
+    SurveyResponseSubmission,
+    record_survey_response,
+    record_survey_responses,
+)
+
+# Deadlock and serialization failures, the transaction can simply be retried
+RETRYABLE_SQLSTATES = ("40P01", "40001")
+
+
+class ResponseBatcherBusyError(Exception):
+    pass
+
+
+def _is_retryable_db_error(error: DBAPIError) -> bool:
+    return getattr(error.orig, "sqlstate", None) in RETRYABLE_SQLSTATES
+
+
+class ResponseBatcher:
+    """Coalesces survey responses from concurrent requests into one multi-row commit.
+
+    The queue holds at most `max_queue_size` responses and a request waits at
+    most `submit_timeout` seconds for its result, then gets a
+    ResponseBatcherBusyError instead of hanging. A batch that fails is retried
+    on a deadlock and otherwise recorded row by row, so one bad response only
+    fails its own request.
+    """
+
+    def __init__(
+        self,
+        app: Flask,
+        max_batch_size: int = 100,
+        max_latency: float = 0.005,
+        max_queue_size: int = 1000,
+        submit_timeout: float = 5.0,
+        max_retries: int = 3,
+    ):
+        self.app = app
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.max_queue_size = max_queue_size
+        self.submit_timeout = submit_timeout
+        self.max_retries = max_retries
+        self.batches = 0
+        self.rows = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.retries = 0
+        self.fallbacks = 0
+        self._queue: "queue.Queue[Tuple[SurveyResponseSubmission, Future]]" = (
+            queue.Queue(maxsize=max_queue_size)
+        )
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+
+    def submit(self, submission: SurveyResponseSubmission) -> SurveyResponseOutcome:
+        self._ensure_started()
+        future: Future = Future()
+        deadline = time.monotonic() + self.submit_timeout
+        try:
+            self._queue.put((submission, future), timeout=self.submit_timeout)
+        except queue.Full:
+            with self._stats_lock:
+                self.rejected += 1
+            raise ResponseBatcherBusyError(
+                f"Response queue is full ({self.max_queue_size} responses waiting)"
+            )
+
+        try:
+            return future.result(timeout=max(deadline - time.monotonic(), 0))
+        except FutureTimeoutError:
+            # Dropped if it has not been flushed yet, otherwise it may still be
+            # recorded after the caller gave up
+            future.cancel()
+            with self._stats_lock:
+                self.timed_out += 1
+            raise ResponseBatcherBusyError(
+                f"Response was not recorded within {self.submit_timeout}s"
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {
+                "queueDepth": self._queue.qsize(),
+                "batches": self.batches,
+                "rows": self.rows,
+                "rejected": self.rejected,
+                "timedOut": self.timed_out,
+                "retries": self.retries,
+                "fallbacks": self.fallbacks,
+                "maxBatchSize": self.max_batch_size,
+                "maxLatencyMs": self.max_latency * 1000,
+                "maxQueueSize": self.max_queue_size,
+            }
+
+    def _ensure_started(self) -> None:
+        # The flusher is started lazily so a forked worker gets its own thread
+        if self._thread is not None:
+            return
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="response-batcher", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_latency
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._flush(batch)
+
+    def _record(
+        self, submissions: List[SurveyResponseSubmission]
+    ) -> List[SurveyResponseOutcome]:
+        attempt = 0
+        while True:
+            try:
+                return record_survey_responses(submissions)
+            except DBAPIError as e:
+                db.session.rollback()
+                if not _is_retryable_db_error(e) or attempt >= self.max_retries:
+                    raise
+            attempt += 1
+            with self._stats_lock:
+                self.retries += 1
+
+    def _flush(self, batch: List[Tuple[SurveyResponseSubmission, Future]]) -> None:
+        # Skip the responses whose request already timed out
+        batch = [
+            (submission, future)
+            for submission, future in batch
+            if future.set_running_or_notify_cancel()
+        ]
+        if not batch:
+            return
+
+        with self.app.app_context():
+            try:
+                try:
+                    outcomes = self._record([submission for submission, _ in batch])
+                except Exception as e:
+                    db.session.rollback()
+                    self.app.logger.warning(
+                        f"Failed to record {len(batch)} survey responses, "
+                        f"recording them one by one: {e}"
+                    )
+                    with self._stats_lock:
+                        self.fallbacks += 1
+                    self._flush_each(batch)
+                    return
+            finally:
+                db.session.remove()
+
+        with self._stats_lock:
+            self.batches += 1
+            self.rows += len(batch)
+        for (_, future), outcome in zip(batch, outcomes):
+            future.set_result(outcome)
+
+    def _flush_each(self, batch: List[Tuple[SurveyResponseSubmission, Future]]) -> None:
+        for submission, future in batch:
+            try:
+                outcome = self._record([submission])[0]
+            except Exception as e:
+                db.session.rollback()
+                self.app.logger.error(f"Failed to record survey response: {e}")
+                future.set_exception(e)
+                continue
+            with self._stats_lock:
+                self.rows += 1
+            future.set_result(outcome)
+
+
+response_batcher: Optional[ResponseBatcher] = None
+
+
+def submit_survey_response(
+    survey_id: UUID4,
+    answer: str,
+    token: Optional[str] = None,
+    email: Optional[str] = None,
+) -> SurveyResponseOutcome:
+    if response_batcher is None:
+        return record_survey_response(survey_id, answer, token=token, email=email)
+    return response_batcher.submit(
+        SurveyResponseSubmission(survey_id, answer, token=token, email=email)
+    )
+
+
+def get_response_batcher_stats() -> Optional[Dict[str, Any]]:
+    return response_batcher.stats() if response_batcher is not None else None
+
+
+def setup_response_batching(app: Flask) -> None:
+    global response_batcher
+
+    if str(app.config.get("RESPONSE_BATCHING", "false")).lower() not in ("1", "true", "yes"):
+        return
+
+    response_batcher = ResponseBatcher(
+        app,
+        max_batch_size=int(app.config.get("RESPONSE_BATCH_MAX_SIZE", 100)),
+        max_latency=float(app.config.get("RESPONSE_BATCH_MAX_LATENCY_MS", 5)) / 1000,
+        max_queue_size=int(app.config.get("RESPONSE_BATCH_QUEUE_SIZE", 1000)),
+        submit_timeout=float(app.config.get("RESPONSE_BATCH_TIMEOUT", 5)),
+    )
+
+
+__all__ = [
+    "RETRYABLE_SQLSTATES",
+    "ResponseBatcherBusyError",
+    "ResponseBatcher",
+    "response_batcher",
+    "submit_survey_response",
+    "get_response_batcher_stats",
+    "setup_response_batching",
+]
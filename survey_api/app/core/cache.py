@@ -0,0 +1,91 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from flask import Flask
+
+
+class TTLCache:
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 60.0,
+        negative_ttl: Optional[float] = None,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        # Misses (cached as None) can be kept for a shorter time than hits
+        self.negative_ttl = ttl if negative_ttl is None else negative_ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False, None
+
+            # Mark the entry as most recently used
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        if ttl is None:
+            ttl = self.negative_ttl if value is None else self.ttl
+        expires_at = time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+
+            # Evict the least recently used entries once over capacity
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxSize": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# Public survey metadata by survey id, None for surveys that don't exist
+public_survey_cache = TTLCache(max_size=10000, ttl=60.0, negative_ttl=10.0)
+
+
+def setup_cache(app: Flask) -> None:
+    public_survey_cache.max_size = int(
+        app.config.get("PUBLIC_SURVEY_CACHE_MAX_SIZE", public_survey_cache.max_size)
+    )
+    public_survey_cache.ttl = float(
+        app.config.get("PUBLIC_SURVEY_CACHE_TTL", public_survey_cache.ttl)
+    )
+    public_survey_cache.negative_ttl = float(
+        app.config.get(
+            "PUBLIC_SURVEY_CACHE_NEGATIVE_TTL", public_survey_cache.negative_ttl
+        )
+    )
+
+
+__all__ = [
+    "TTLCache",
+    "public_survey_cache",
+    "setup_cache",
+]
@@ -0,0 +1,40 @@
+import uuid
+from typing import Optional
+
+import click
+from flask import Flask
+
+from .email_worker import run_email_worker
+from .survey_service import rebuild_survey_result_counters
+from .utils import close_expired_surveys
+
+
+def setup_cli(app: Flask) -> None:
+    @app.cli.command("rebuild-result-counters")
+    @click.option("--survey-id", type=click.UUID, default=None)
+    def rebuild_result_counters(survey_id: Optional[uuid.UUID]):
+        survey_ids = [survey_id] if survey_id else None
+        rebuilt = rebuild_survey_result_counters(survey_ids)
+        click.echo(f"Rebuilt {rebuilt} survey result counters")
+
+    @app.cli.command("close-expired-surveys")
+    def close_expired_surveys_command():
+        survey_ids = close_expired_surveys()
+        click.echo(f"Closed {len(survey_ids)} expired surveys")
+
+    @app.cli.command("email-worker")
+    @click.option("--batch-size", type=int, default=100)
+    @click.option("--poll-interval", type=float, default=2.0)
+    @click.option("--once", is_flag=True, help="Exit when no pending tasks are left")
+    @click.option(
+        "--concurrency",
+        type=int,
+        default=lambda: int(app.config.get("EMAIL_WORKER_CONCURRENCY", 20)),
+        help="Emails sent at once per batch (1 sends them one by one)",
+    )
+    def email_worker(batch_size: int, poll_interval: float, once: bool, concurrency: int):
+        processed = run_email_worker(app, batch_size, poll_interval, once, concurrency)
+        click.echo(f"Processed {processed} email tasks")
+
+
+__all__ = ["setup_cli"]
@@ -0,0 +1,128 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pydantic import UUID4
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from .db import db
+from .models import Contact, ContactList
+
+
+def get_contact_list_by_id(
+    contact_list_id: UUID4, user_id: UUID4
+) -> Tuple[Optional[ContactList], Optional[Tuple[Dict, int]]]:
+    contact_list = ContactList.query.filter_by(
+        id=contact_list_id, owner_id=user_id
+    ).first()
+    if contact_list is None:
+        return None, ({"error": "Contact list not found"}, 404)
+    return contact_list, None
+
+
+def get_contact_lists(user_id: UUID4) -> List[ContactList]:
+    return list(
+        db.session.scalars(
+            select(ContactList)
+            .where(ContactList.owner_id == user_id)
+            .order_by(ContactList.created_at.desc(), ContactList.id.desc())
+        ).all()
+    )
+
+
+def get_contact_list_counts(contact_list_ids: Iterable[UUID4]) -> Dict[UUID4, int]:
+    contact_list_ids = list(contact_list_ids)
+    contact_counts: Dict[UUID4, int] = {
+        contact_list_id: 0 for contact_list_id in contact_list_ids
+    }
+    if not contact_list_ids:
+        return contact_counts
+
+    rows = db.session.execute(
+        select(Contact.contact_list_id, func.count())
+        .where(Contact.contact_list_id.in_(contact_list_ids))
+        .group_by(Contact.contact_list_id)
+    ).all()
+    for contact_list_id, count in rows:
+        contact_counts[contact_list_id] = count
+
+    return contact_counts
+
+
+def get_contact_emails(
+    contact_list_id: UUID4, page: int = 1, page_size: int = 20
+) -> Tuple[List[str], int]:
+    query = select(Contact.email).where(Contact.contact_list_id == contact_list_id)
+
+    total = db.session.scalar(select(func.count()).select_from(query.subquery()))
+    contact_emails = db.session.scalars(
+        query.order_by(Contact.email).offset((page - 1) * page_size).limit(page_size)
+    ).all()
+
+    return list(contact_emails), total
+
+
+def add_contacts(contact_list_id: UUID4, emails: List[str]) -> int:
+    if not emails:
+        return 0
+
+    # Multi-row insert that skips addresses already on the list; the caller owns
+    # the transaction
+    inserted = db.session.execute(
+        pg_insert(Contact.__table__)
+        .on_conflict_do_nothing(index_elements=["contact_list_id", "email"])
+        .returning(Contact.__table__.c.id),
+        [{"contact_list_id": contact_list_id, "email": email} for email in emails],
+    ).all()
+
+    return len(inserted)
+
+
+# Creates a survey's recipients (with fresh response tokens) and pending email
+# tasks from a contact list in one set-based statement
+ADD_CONTACT_LIST_RECIPIENTS_STATEMENT = text(
+    """
+    WITH new_recipients AS (
+        INSERT INTO recipient (id, survey_id, email, response_token)
+        SELECT
+            gen_random_uuid(),
+            CAST(:survey_id AS uuid),
+            c.email,
+            replace(gen_random_uuid()::text || gen_random_uuid()::text, '-', '')
+        FROM contact AS c
+        WHERE c.contact_list_id = CAST(:contact_list_id AS uuid)
+        ORDER BY c.email
+        ON CONFLICT (survey_id, email) DO NOTHING
+        RETURNING email
+    ),
+    new_tasks AS (
+        INSERT INTO email_task (id, survey_id, recipient_email, status)
+        SELECT
+            gen_random_uuid(),
+            CAST(:survey_id AS uuid),
+            email,
+            CAST('PENDING' AS emailtaskstatus)
+        FROM new_recipients
+    )
+    SELECT email FROM new_recipients
+    """
+)
+
+
+def add_contact_list_recipients(survey_id: UUID4, contact_list_id: UUID4) -> List[str]:
+    return list(
+        db.session.scalars(
+            ADD_CONTACT_LIST_RECIPIENTS_STATEMENT,
+            {"survey_id": str(survey_id), "contact_list_id": str(contact_list_id)},
+        ).all()
+    )
+
+
+__all__ = [
+    "get_contact_list_by_id",
+    "get_contact_lists",
+    "get_contact_list_counts",
+    "get_contact_emails",
+    "add_contacts",
+    "ADD_CONTACT_LIST_RECIPIENTS_STATEMENT",
+    "add_contact_list_recipients",
+]
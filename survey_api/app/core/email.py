@@ -1,10 +1,32 @@
-from datetime import datetime, timezone
-from typing import List, Optional
-from .email_sender import EmailSender, get_email_sender
+import os
+import socket
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+from .email_dispatcher import AsyncEmailDispatcher, EmailJob
+from .email_sender import (
+    BatchRecipient,
+    EmailSender,
+    get_email_sender,
+    is_retryable_email_error,
+    render_recipient_body,
+)
 from flask import current_app
-from urllib.parse import urlencode
+from sqlalchemy import (
+    ColumnElement,
+    and_,
+    case,
+    cast,
+    func,
+    null,
+    or_,
+    select,
+    update,
+)
+from urllib.parse import quote, urlencode
 
 from .db import db
+from .templating import CompiledTemplate
 from .models import (
     EmailTask,
     EmailTaskStatus,
@@ -13,6 +35,7 @@ from .models import (
     SurveyAnswer,
     SurveyStatus,
 )
+from .versioning import bump_survey_version
 
 
 def send_email(recipient_email: str, subject: str, body: str) -> None:
@@ -75,87 +98,354 @@ SURVEY_INVITE_EMAIL_TEMPLATE = """
     &copy; {year} Survey Master
   </div>
 """
+SURVEY_INVITE_EMAIL = CompiledTemplate(SURVEY_INVITE_EMAIL_TEMPLATE)
 
 
-def send_survey_emails(survey_id: str) -> None:
-    with current_app.app_context():
-        survey: Optional[Survey] = Survey.query.get(survey_id)
-        if not survey:
-            current_app.logger.warning(f"Survey {survey_id} not found.")
-            return
-        if survey.status == SurveyStatus.CLOSED.value:
+def answer_link_template(survey_id: str, answer: str) -> CompiledTemplate:
+    # Same link as generate_answer_link, with the token left as a field
+    base_url: str = current_app.config.get("WEB_ORIGIN")
+    params: str = urlencode({"answer": answer})
+    return CompiledTemplate(f"{base_url}/respond/{survey_id}?token={{token}}&{params}")
+
+
+def build_survey_invite_template(
+    survey_id: str, survey_name: str, survey_question: str
+) -> Tuple[str, CompiledTemplate]:
+    # Everything but the recipient's token is rendered (and escaped) once per
+    # survey; see get_survey_invite_variables
+    subject = SURVEY_INVITE_EMAIL_SUBJECT.format(survey_name=survey_name)
+    body = SURVEY_INVITE_EMAIL.partial(
+        survey_name=survey_name,
+        survey_question=survey_question,
+        yes_link=answer_link_template(survey_id, SurveyAnswer.YES.value),
+        no_link=answer_link_template(survey_id, SurveyAnswer.NO.value),
+        cant_link=answer_link_template(survey_id, SurveyAnswer.CANT_ANSWER.value),
+        year=datetime.now().year,
+    )
+    return subject, body
+
+
+def get_survey_invite_variables(response_token: str) -> Dict[str, str]:
+    return {"token": quote(response_token, safe="")}
+
+
+def build_survey_invite_email(
+    survey_id: str, survey_name: str, survey_question: str, response_token: str
+) -> Tuple[str, str]:
+    subject, body = build_survey_invite_template(survey_id, survey_name, survey_question)
+    return subject, body.render(**get_survey_invite_variables(response_token))
+
+
+def get_email_worker_id() -> str:
+    # Unique per dispatch run, so two runs in one process never share a lease
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+
+def reset_failed_email_tasks(survey_id: str) -> int:
+    reset = db.session.execute(
+        update(EmailTask)
+        .where(
+            EmailTask.survey_id == survey_id,
+            EmailTask.status == EmailTaskStatus.FAILED,
+        )
+        .values(
+            status=EmailTaskStatus.PENDING,
+            attempts=0,
+            next_attempt_at=None,
+            locked_until=None,
+            locked_by=None,
+        )
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if reset:
+        bump_survey_version(survey_id)
+    db.session.commit()
+    return reset
+
+
+def claim_email_tasks(
+    worker_id: str,
+    batch_size: int = 100,
+    lease_seconds: Optional[float] = None,
+    survey_id: Optional[str] = None,
+) -> List[UUID]:
+    if lease_seconds is None:
+        lease_seconds = float(current_app.config.get("EMAIL_TASK_LEASE_SECONDS", 300))
+
+    # Pending tasks of open surveys that are due (new ones first, then retries by
+    # time) and whose lease (if any) has run out; rows other workers are claiming
+    # right now are skipped instead of waited on
+    claimable = (
+        select(EmailTask.id)
+        .join(Survey, Survey.id == EmailTask.survey_id)
+        .where(
+            EmailTask.status == EmailTaskStatus.PENDING,
+            or_(EmailTask.locked_until.is_(None), EmailTask.locked_until < func.now()),
+            or_(
+                EmailTask.next_attempt_at.is_(None),
+                EmailTask.next_attempt_at <= func.now(),
+            ),
+            Survey.status == SurveyStatus.ACTIVE,
+            Survey.end_date > func.now(),
+        )
+        .order_by(EmailTask.next_attempt_at.asc().nulls_first())
+        .limit(batch_size)
+        .with_for_update(of=EmailTask, skip_locked=True)
+    )
+    if survey_id is not None:
+        claimable = claimable.where(EmailTask.survey_id == survey_id)
+
+    task_ids = list(
+        db.session.scalars(
+            update(EmailTask)
+            .where(EmailTask.id.in_(claimable.scalar_subquery()))
+            .values(
+                locked_until=func.now() + timedelta(seconds=lease_seconds),
+                locked_by=worker_id,
+            )
+            .returning(EmailTask.id)
+            .execution_options(synchronize_session=False)
+        )
+    )
+    db.session.commit()
+    return task_ids
+
+
+def get_email_retry_delay(attempts: ColumnElement) -> ColumnElement:
+    # Exponential backoff in seconds, capped, with jitter so tasks that failed
+    # together (e.g. during a provider outage) are not all retried at once
+    base_delay = float(current_app.config.get("EMAIL_TASK_RETRY_BASE_DELAY", 30))
+    max_delay = float(current_app.config.get("EMAIL_TASK_RETRY_MAX_DELAY", 3600))
+    backoff = func.least(base_delay * func.power(2.0, attempts), max_delay)
+    return backoff * (0.5 + func.random() * 0.5)
+
+
+def _finish_email_tasks(
+    worker_id: str, finished: List[Tuple[UUID, UUID, Optional[str], bool]]
+) -> None:
+    # Writes a batch of (task_id, survey_id, error, retryable) outcomes in one
+    # transaction: one UPDATE for the sent tasks, one per distinct error and one
+    # version bump per survey. A task whose lease ran out may have been claimed
+    # again; only its current holder may finish it
+    if not finished:
+        return
+
+    task_ids_by_error: Dict[Tuple[Optional[str], bool], List[UUID]] = {}
+    for task_id, _, error, retryable in finished:
+        task_ids_by_error.setdefault((error, retryable), []).append(task_id)
+
+    max_attempts = int(current_app.config.get("EMAIL_TASK_MAX_ATTEMPTS", 5))
+    for (error, retryable), task_ids in task_ids_by_error.items():
+        if error is None:
+            values = {
+                "status": EmailTaskStatus.SENT,
+                "sent_at": datetime.now(timezone.utc),
+                "next_attempt_at": None,
+                "last_error": None,
+            }
+        elif retryable:
+            # Back to PENDING until the last attempt, then dead-lettered as FAILED
+            exhausted = EmailTask.attempts + 1 >= max_attempts
+            values = {
+                "status": cast(
+                    case(
+                        (exhausted, EmailTaskStatus.FAILED.value),
+                        else_=EmailTaskStatus.PENDING.value,
+                    ),
+                    EmailTask.status.type,
+                ),
+                "next_attempt_at": case(
+                    (exhausted, null()),
+                    else_=func.now()
+                    + func.make_interval(
+                        0, 0, 0, 0, 0, 0, get_email_retry_delay(EmailTask.attempts)
+                    ),
+                ),
+                "last_error": error,
+            }
+        else:
+            values = {
+                "status": EmailTaskStatus.FAILED,
+                "next_attempt_at": None,
+                "last_error": error,
+            }
+
+        db.session.execute(
+            update(EmailTask)
+            .where(EmailTask.id.in_(task_ids), EmailTask.locked_by == worker_id)
+            .values(
+                attempts=EmailTask.attempts + 1,
+                locked_until=None,
+                locked_by=None,
+                **values,
+            )
+            .execution_options(synchronize_session=False)
+        )
+    for survey_id in dict.fromkeys(survey_id for _, survey_id, _, _ in finished):
+        bump_survey_version(survey_id)
+    db.session.commit()
+
+
+def send_claimed_email_tasks(
+    task_ids: List[UUID],
+    worker_id: str,
+    concurrency: int = 1,
+    load_batch_size: int = 1000,
+) -> None:
+    # Tasks, their survey and the recipient's token come from one joined query,
+    # read in chunks through a server-side cursor
+    rows = db.session.execute(
+        select(
+            EmailTask.id,
+            EmailTask.recipient_email,
+            Survey.id,
+            Survey.name,
+            Survey.question,
+            Recipient.response_token,
+        )
+        .join(Survey, Survey.id == EmailTask.survey_id)
+        .outerjoin(
+            Recipient,
+            and_(
+                Recipient.survey_id == EmailTask.survey_id,
+                Recipient.email == EmailTask.recipient_email,
+            ),
+        )
+        .where(EmailTask.id.in_(task_ids))
+        .execution_options(yield_per=load_batch_size)
+    )
+
+    # Group the batch by survey, each survey's email is built once
+    templates: Dict[UUID, Tuple[str, CompiledTemplate]] = {}
+    recipients: Dict[UUID, List[Tuple[UUID, BatchRecipient]]] = {}
+    finished: List[Tuple[UUID, UUID, Optional[str], bool]] = []
+    for task_id, recipient_email, survey_id, survey_name, survey_question, token in rows:
+        if token is None:
             current_app.logger.info(
-                f"Survey {survey_id} is CLOSED. No emails will be sent."
+                f"Recipient {recipient_email} not found for survey {survey_id}"
             )
-            return
+            finished.append((task_id, survey_id, "Recipient not found", False))
+            continue
 
-        # Reset failed tasks to pending
-        failed_tasks = EmailTask.query.filter(
-            EmailTask.survey_id == survey_id, EmailTask.status == EmailTaskStatus.FAILED
-        ).all()
-        for task in failed_tasks:
-            task.status = EmailTaskStatus.PENDING
-        if failed_tasks:
-            db.session.commit()
+        if survey_id not in templates:
+            templates[survey_id] = build_survey_invite_template(
+                str(survey_id), survey_name, survey_question
+            )
+            recipients[survey_id] = []
+        recipients[survey_id].append(
+            (
+                task_id,
+                BatchRecipient(recipient_email, get_survey_invite_variables(token)),
+            )
+        )
 
-        # Get all pending tasks
-        tasks_to_send: List[EmailTask] = EmailTask.query.filter(
-            EmailTask.survey_id == survey_id,
-            EmailTask.status.in_([EmailTaskStatus.PENDING]),
-        ).all()
+    # Save the missing recipients and end the transaction the SELECT opened, even
+    # when there is nothing to save, so none stays open while emails are sent
+    _finish_email_tasks(worker_id, finished)
+    db.session.commit()
+
+    email_sender = get_email_sender()
+    for survey_id, survey_recipients in recipients.items():
+        subject, body = templates[survey_id]
+        batch = [recipient for _, recipient in survey_recipients]
         current_app.logger.info(
-            f"Found {len(tasks_to_send)} email tasks (pending) for survey {survey_id}"
+            f"Preparing to send {len(batch)} invitation emails for survey {survey_id}"
         )
 
-        # Process each task
-        for task in tasks_to_send:
-            recipient: Optional[Recipient] = Recipient.query.filter_by(
-                survey_id=survey_id, email=task.recipient_email
-            ).first()
-            if not recipient:
+        if concurrency > 1 and email_sender.max_batch_size == 1:
+            # No native batch API: send concurrently on an event loop instead
+            dispatcher = AsyncEmailDispatcher(email_sender, concurrency=concurrency)
+            errors = dispatcher.send_all(
+                [
+                    EmailJob(
+                        recipient.email,
+                        subject,
+                        render_recipient_body(body, recipient.variables),
+                    )
+                    for recipient in batch
+                ]
+            )
+        else:
+            errors = email_sender.send_batch(subject, body, batch)
+
+        finished = []
+        for (task_id, recipient), error in zip(survey_recipients, errors):
+            if error is None:
                 current_app.logger.info(
-                    f"Recipient {task.recipient_email} not found for survey {survey_id}"
+                    f"Marked email as SENT for {recipient.email} in survey {survey_id}"
                 )
+                finished.append((task_id, survey_id, None, True))
                 continue
 
-            # Prepare email content
-            subject = SURVEY_INVITE_EMAIL_SUBJECT.format(survey_name=survey.name)
-            yes_link = generate_answer_link(
-                survey_id, recipient.response_token, SurveyAnswer.YES.value
-            )
-            no_link = generate_answer_link(
-                survey_id, recipient.response_token, SurveyAnswer.NO.value
-            )
-            cant_link = generate_answer_link(
-                survey_id, recipient.response_token, SurveyAnswer.CANT_ANSWER.value
-            )
-            body = SURVEY_INVITE_EMAIL_TEMPLATE.format(
-                survey_name=survey.name,
-                survey_question=survey.question,
-                yes_link=yes_link,
-                no_link=no_link,
-                cant_link=cant_link,
-                year=datetime.now().year,
+            # Permanent errors (e.g. an invalid address) are dead-lettered at once
+            retryable = is_retryable_email_error(error)
+            current_app.logger.warning(
+                f"Failed to send email to {recipient.email} for survey {survey_id}"
+                f"{'' if retryable else ' (permanent)'}: {error}"
             )
+            finished.append((task_id, survey_id, str(error)[:1000], retryable))
+        # Each survey's outcomes are saved as soon as it is sent
+        _finish_email_tasks(worker_id, finished)
+
+
+def dispatch_email_tasks(
+    worker_id: str,
+    batch_size: int = 100,
+    survey_id: Optional[str] = None,
+    concurrency: int = 1,
+) -> int:
+    task_ids = claim_email_tasks(worker_id, batch_size, survey_id=survey_id)
+    if task_ids:
+        send_claimed_email_tasks(task_ids, worker_id, concurrency)
+    return len(task_ids)
+
 
-            # Send email
+def dispatch_due_email_tasks() -> int:
+    # Sends every due task of any survey: retries whose backoff has passed and
+    # tasks left pending when the worker pool was full. SKIP LOCKED keeps
+    # replicas from sending the same task
+    worker_id = get_email_worker_id()
+    batch_size = int(current_app.config.get("EMAIL_DISPATCH_BATCH_SIZE", 1000))
+    concurrency = int(current_app.config.get("EMAIL_WORKER_CONCURRENCY", 20))
+    sent = 0
+    while claimed := dispatch_email_tasks(worker_id, batch_size, concurrency=concurrency):
+        sent += claimed
+    if sent:
+        current_app.logger.info(f"Processed {sent} due email tasks")
+    return sent
+
+
+def dispatch_survey_emails(survey_id: str) -> None:
+    # Sends the survey's PENDING tasks only; dead-lettered FAILED tasks are left
+    # alone until the owner retries them (see send_survey_emails)
+    with current_app.app_context():
+        survey: Optional[Survey] = Survey.query.get(survey_id)
+        if not survey:
+            current_app.logger.warning(f"Survey {survey_id} not found.")
+            return
+        if survey.status == SurveyStatus.CLOSED:
             current_app.logger.info(
-                f"Preparing to send invitation email to {task.recipient_email} for survey {survey_id}"
+                f"Survey {survey_id} is CLOSED. No emails will be sent."
             )
-            try:
-                send_email(task.recipient_email, subject, body)
-                task.status = EmailTaskStatus.SENT
-                task.sent_at = datetime.now(timezone.utc)
-                current_app.logger.info(
-                    f"Marked email as SENT for {task.recipient_email} in survey {survey_id}"
-                )
-            except Exception as e:
-                task.status = EmailTaskStatus.FAILED
-                current_app.logger.warning(
-                    f"Failed to send email to {task.recipient_email} for survey {survey_id}: {e}"
-                )
-            finally:
-                db.session.commit()
+            return
+
+        # Claim and send pending tasks in batches, so an email worker running at
+        # the same time never sends the same task
+        worker_id = get_email_worker_id()
+        sent = 0
+        batch_size = int(current_app.config.get("EMAIL_DISPATCH_BATCH_SIZE", 1000))
+        while claimed := dispatch_email_tasks(worker_id, batch_size, survey_id=survey_id):
+            sent += claimed
+        current_app.logger.info(
+            f"Processed {sent} email tasks (pending) for survey {survey_id}"
+        )
+
+
+def send_survey_emails(survey_id: str) -> None:
+    # The owner's explicit retry: failed tasks get a fresh set of attempts
+    with current_app.app_context():
+        reset_failed_email_tasks(survey_id)
+        dispatch_survey_emails(survey_id)
 
 
 SURVEY_ENDED_EMAIL_SUBJECT = "Survey '{survey_name}' has ended"
@@ -179,6 +469,7 @@ SURVEY_ENDED_EMAIL_TEMPLATE = """
   </div>
 </div>
 """
+SURVEY_ENDED_EMAIL = CompiledTemplate(SURVEY_ENDED_EMAIL_TEMPLATE)
 
 
 def send_survey_ended_email(survey_id: str) -> None:
@@ -187,12 +478,27 @@ def send_survey_ended_email(survey_id: str) -> None:
         if not survey:
             current_app.logger.warning(f"Survey {survey_id} not found.")
             return
-        if not survey.status == SurveyStatus.CLOSED.value:
+        if not survey.status == SurveyStatus.CLOSED:
             current_app.logger.info(
                 f"Survey {survey_id} is not CLOSED. No ended emails will be sent."
             )
             return
 
+        # Claim the pending flag so a job submitted again by a later sweep
+        # does not send the same emails twice
+        is_claimed = db.session.execute(
+            update(Survey)
+            .where(Survey.id == survey.id, Survey.ended_email_pending.is_(True))
+            .values(ended_email_pending=False)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.session.commit()
+        if not is_claimed:
+            current_app.logger.info(
+                f"Survey ended emails for survey {survey_id} were already sent."
+            )
+            return
+
         # Get all recipients
         recipients: List[Recipient] = Recipient.query.filter_by(
             survey_id=survey.id
@@ -203,34 +509,48 @@ def send_survey_ended_email(survey_id: str) -> None:
 
         # Prepare email content
         subject = SURVEY_ENDED_EMAIL_SUBJECT.format(survey_name=survey.name)
-        body = SURVEY_ENDED_EMAIL_TEMPLATE.format(
+        body = SURVEY_ENDED_EMAIL.render(
             survey_name=survey.name,
             year=datetime.now().year,
         )
 
-        # Send emails to each recipient
-        for recipient in recipients:
-            current_app.logger.info(
-                f"Sending survey ended email to {recipient.email} for survey {survey.id}"
-            )
-            try:
-                send_email(recipient.email, subject, body)
+        # Send emails in provider-sized batches
+        email_sender = get_email_sender()
+        errors = email_sender.send_batch(
+            subject, body, [BatchRecipient(recipient.email) for recipient in recipients]
+        )
+        for recipient, error in zip(recipients, errors):
+            if error is None:
                 current_app.logger.info(
                     f"Survey ended email sent to {recipient.email} for survey {survey.id}"
                 )
-            except Exception as e:
+            else:
                 current_app.logger.warning(
-                    f"Failed to send survey ended email to {recipient.email} for survey {survey.id}: {e}"
+                    f"Failed to send survey ended email to {recipient.email} for survey {survey.id}: {error}"
                 )
 
 
 __all__ = [
     "send_email",
+    "build_survey_invite_template",
+    "get_survey_invite_variables",
+    "build_survey_invite_email",
+    "get_email_worker_id",
+    "reset_failed_email_tasks",
+    "claim_email_tasks",
+    "get_email_retry_delay",
+    "send_claimed_email_tasks",
+    "dispatch_email_tasks",
+    "dispatch_due_email_tasks",
+    "dispatch_survey_emails",
     "send_survey_emails",
     "send_survey_ended_email",
     "generate_answer_link",
+    "answer_link_template",
     "SURVEY_INVITE_EMAIL_SUBJECT",
     "SURVEY_INVITE_EMAIL_TEMPLATE",
+    "SURVEY_INVITE_EMAIL",
     "SURVEY_ENDED_EMAIL_SUBJECT",
     "SURVEY_ENDED_EMAIL_TEMPLATE",
+    "SURVEY_ENDED_EMAIL",
 ]
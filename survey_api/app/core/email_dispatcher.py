@@ -0,0 +1,142 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import httpx
+
+from .email_sender import EmailRequest, EmailSender
+from .rate_limit import get_throttle_delay
+
+
+class AsyncRateLimiter:
+    """Spaces requests evenly so no more than `rate` start per second"""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+@dataclass
+class EmailJob:
+    recipient_email: str
+    subject: str
+    body: str
+
+
+class AsyncEmailDispatcher:
+    """Sends many emails concurrently on one event loop with async HTTP.
+
+    Requests are built by the provider's EmailSender (so payloads, sandboxing and
+    credentials are shared with the blocking path) and sent with httpx, at most
+    `concurrency` at a time. They are paced by the sender's shared rate limiter,
+    or no faster than `rate_limit` per second in this process when it is given.
+    Throttled requests are retried after their Retry-After like the sender does.
+    """
+
+    def __init__(
+        self,
+        email_sender: EmailSender,
+        concurrency: int = 20,
+        rate_limit: Optional[float] = None,
+        timeout: Optional[Tuple[float, float]] = None,
+    ):
+        self.email_sender = email_sender
+        self.concurrency = concurrency
+        # An explicit rate replaces the sender's shared limiter instead of being
+        # stacked on it; a provider without a shared limiter is uncapped
+        self.rate_limit = rate_limit
+        self.shared_rate_limiter = (
+            email_sender.rate_limiter if rate_limit is None else None
+        )
+        connect_timeout, read_timeout = timeout or email_sender.timeout
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+
+    async def _acquire(self, rate_limiter: Optional[AsyncRateLimiter]) -> None:
+        if rate_limiter is not None:
+            await rate_limiter.acquire()
+        elif self.shared_rate_limiter is not None:
+            # The shared limiter talks to the database, off the event loop
+            wait = await asyncio.to_thread(self.shared_rate_limiter.reserve)
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        rate_limiter: Optional[AsyncRateLimiter],
+        email_request: EmailRequest,
+    ) -> Optional[Exception]:
+        async with semaphore:
+            retry = 0
+            try:
+                while True:
+                    await self._acquire(rate_limiter)
+                    response = await client.post(
+                        email_request.url,
+                        headers=email_request.headers,
+                        json=email_request.json,
+                        data=email_request.data,
+                        auth=email_request.auth,
+                    )
+                    delay = get_throttle_delay(response.status_code, response.headers)
+                    if delay is not None:
+                        delay = await asyncio.to_thread(
+                            self.email_sender.get_retry_delay, retry, delay
+                        )
+                    if delay is None:
+                        break
+                    # The shared limiter already holds every request back
+                    if self.shared_rate_limiter is None:
+                        await asyncio.sleep(delay)
+                    retry += 1
+                response.raise_for_status()
+            except Exception as e:
+                return e
+        return None
+
+    async def _send_all(self, email_requests: List[EmailRequest]) -> List[Optional[Exception]]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        rate_limiter = (
+            AsyncRateLimiter(self.rate_limit) if self.rate_limit is not None else None
+        )
+        limits = httpx.Limits(
+            max_connections=self.concurrency, max_keepalive_connections=self.concurrency
+        )
+        async with httpx.AsyncClient(timeout=self.timeout, limits=limits) as client:
+            return await asyncio.gather(
+                *(
+                    self._send(client, semaphore, rate_limiter, email_request)
+                    for email_request in email_requests
+                )
+            )
+
+    def send_all(self, jobs: List[EmailJob]) -> List[Optional[Exception]]:
+        # Requests are built here, inside the caller's app context; the event
+        # loop only does HTTP. Returns one error (or None) per job, in order.
+        email_requests = [
+            self.email_sender.build_request(job.recipient_email, job.subject, job.body)
+            for job in jobs
+        ]
+        if not email_requests:
+            return []
+        return asyncio.run(self._send_all(email_requests))
+
+
+__all__ = [
+    "AsyncRateLimiter",
+    "EmailJob",
+    "AsyncEmailDispatcher",
+]
@@ -1,25 +1,273 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+import json
 
 from flask import current_app
+import os
+import httpx
 import requests
-from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+import threading
+from typing import Dict, Any, List, Optional, Tuple, Union
 import time
 
+from .db import db
+from .rate_limit import (
+    DEFAULT_PROVIDER_RATE_LIMITS,
+    ProviderRateLimiter,
+    get_throttle_delay,
+)
+from .templating import CompiledTemplate
+
+
+@dataclass
+class EmailRequest:
+    url: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    json: Optional[Dict[str, Any]] = None
+    data: Optional[Dict[str, Any]] = None
+    auth: Optional[Tuple[str, str]] = None
+
+
+@dataclass
+class BatchRecipient:
+    email: str
+    # Per-recipient values for the %recipient.<name>% placeholders in the body
+    variables: Dict[str, str] = field(default_factory=dict)
+
+
+class EmailSendError(Exception):
+    """A provider rejected one message of an otherwise successful call"""
+
+    def __init__(self, message: str, retryable: bool = False):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+# HTTP statuses worth retrying later, any other error status is permanent
+RETRYABLE_STATUS_CODES = (408, 429)
+
+
+def is_retryable_email_error(error: Exception) -> bool:
+    # Network trouble, timeouts, throttling and provider 5xx are transient; an
+    # invalid address, bad credentials or a rejected payload will fail again
+    if isinstance(error, EmailSendError):
+        return error.retryable
+    if isinstance(
+        error, (requests.ConnectionError, requests.Timeout, httpx.TransportError)
+    ):
+        return True
+    response = getattr(error, "response", None)
+    if response is None:
+        return False
+    return response.status_code in RETRYABLE_STATUS_CODES or response.status_code >= 500
+
+
+def recipient_placeholder(name: str) -> str:
+    # Mailgun's syntax, also used as SendGrid substitution keys
+    return f"%recipient.{name}%"
+
+
+def render_recipient_body(
+    body: Union[str, CompiledTemplate], variables: Dict[str, str]
+) -> str:
+    if isinstance(body, CompiledTemplate):
+        return body.render(**variables)
+    for name, value in variables.items():
+        body = body.replace(recipient_placeholder(name), value)
+    return body
+
+
+def with_recipient_placeholders(body: Union[str, CompiledTemplate]) -> str:
+    # For providers that substitute per-recipient values server-side
+    if isinstance(body, CompiledTemplate):
+        return body.render(**{name: recipient_placeholder(name) for name in body.fields})
+    return body
+
 
 class EmailSender(ABC):
+    """Sender with a keep-alive HTTP session, meant to live for the whole process"""
+
+    # Name used in log lines and rate limit settings
+    provider: str = "local"
+    # Recipients per provider call in send_batch (1 = no native batching)
+    max_batch_size: int = 1
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        timeout: Tuple[float, float] = (5.0, 30.0),
+        rate_limiter: Optional[ProviderRateLimiter] = None,
+        max_throttle_retries: int = 3,
+        max_throttle_wait: float = 60.0,
+    ):
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.max_throttle_retries = max_throttle_retries
+        self.max_throttle_wait = max_throttle_wait
+        self.throttled = 0
+        self.session = requests.Session()
+        # A single provider host, so one pool sized for concurrent senders
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._adapter = adapter
+
+    def get_retry_delay(self, retry: int, delay: Optional[float]) -> Optional[float]:
+        # How long to back off before retrying a throttled request, or None to give
+        # up and let the caller fail (the email task is retried later)
+        if delay is None or retry >= self.max_throttle_retries:
+            return None
+        if delay > self.max_throttle_wait:
+            return None
+        self.throttled += 1
+        if self.rate_limiter is not None:
+            # Every worker waits, not only this one
+            self.rate_limiter.block(delay)
+        return delay
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        # Waits for the provider's rate limit and retries throttled requests after
+        # their Retry-After
+        kwargs.setdefault("timeout", self.timeout)
+        retry = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            response = self.session.post(url, **kwargs)
+            delay = self.get_retry_delay(
+                retry, get_throttle_delay(response.status_code, response.headers)
+            )
+            if delay is None:
+                return response
+            current_app.logger.warning(
+                f"[{self.provider}] Throttled with status {response.status_code}, retrying in {delay:.1f}s"
+            )
+            if self.rate_limiter is None:
+                time.sleep(delay)
+            retry += 1
+
+    def stats(self) -> Dict[str, Any]:
+        pool_manager = self._adapter.poolmanager
+        pools = [pool_manager.pools[key] for key in pool_manager.pools.keys()]
+        requests_sent = sum(pool.num_requests for pool in pools)
+        connections_opened = sum(pool.num_connections for pool in pools)
+        return {
+            "provider": self.provider,
+            "requests": requests_sent,
+            "connectionsOpened": connections_opened,
+            "connectionsReused": max(requests_sent - connections_opened, 0),
+            "throttled": self.throttled,
+            "rateLimit": self.rate_limiter.stats() if self.rate_limiter else None,
+        }
+
+    def close(self) -> None:
+        self.session.close()
+
+    def get_recipient(self, recipient_email: str) -> str:
+        sandbox_recipient: Optional[str] = current_app.config.get(
+            "EMAIL_SANDBOX_RECIPIENT"
+        )
+        if sandbox_recipient:
+            current_app.logger.info(
+                f"[{self.provider}] Sandbox mode active. Overriding recipient {recipient_email} -> {sandbox_recipient}"
+            )
+            return sandbox_recipient
+        return recipient_email
+
     @abstractmethod
-    def send_email(self, recipient_email: str, subject: str, body: str) -> None:
+    def build_request(self, recipient_email: str, subject: str, body: str) -> EmailRequest:
         pass
 
+    def send_batch_chunk(
+        self,
+        subject: str,
+        body: Union[str, CompiledTemplate],
+        recipients: List[BatchRecipient],
+    ) -> List[Optional[Exception]]:
+        # Fallback: one request per recipient
+        errors: List[Optional[Exception]] = []
+        for recipient in recipients:
+            try:
+                self.send_email(
+                    recipient.email, subject, render_recipient_body(body, recipient.variables)
+                )
+                errors.append(None)
+            except Exception as e:
+                errors.append(e)
+        return errors
+
+    def send_batch(
+        self,
+        subject: str,
+        body: Union[str, CompiledTemplate],
+        recipients: List[BatchRecipient],
+    ) -> List[Optional[Exception]]:
+        """Send one email to many recipients, personalised through placeholders.
+
+        Returns one error (or None) per recipient, in order. In sandbox mode every
+        message goes to the same address, so recipients are sent one by one.
+        """
+        batch_size = self.max_batch_size
+        if current_app.config.get("EMAIL_SANDBOX_RECIPIENT"):
+            batch_size = 1
+
+        errors: List[Optional[Exception]] = []
+        for start in range(0, len(recipients), batch_size):
+            chunk = recipients[start : start + batch_size]
+            if batch_size == 1:
+                errors.extend(EmailSender.send_batch_chunk(self, subject, body, chunk))
+                continue
+            try:
+                errors.extend(self.send_batch_chunk(subject, body, chunk))
+                current_app.logger.info(
+                    f"[{self.provider}] Sent batch of {len(chunk)} emails with subject '{subject}'"
+                )
+            except Exception as e:
+                # The whole call failed, so did every recipient in it
+                errors.extend([e] * len(chunk))
+        return errors
+
+    def send_email(self, recipient_email: str, subject: str, body: str) -> None:
+        email_request = self.build_request(recipient_email, subject, body)
+        response = self.post(
+            email_request.url,
+            headers=email_request.headers,
+            json=email_request.json,
+            data=email_request.data,
+            auth=email_request.auth,
+        )
+        current_app.logger.info(
+            f"[{self.provider}] Sent email to {recipient_email}, status: {response.status_code}"
+        )
+        response.raise_for_status()
+
 
 class LocalEmailSender(EmailSender):
+    provider = "local"
+
     # Artificial delay (in seconds) for sending each email, for local development/testing
     EMAIL_SEND_ARTIFICIAL_DELAY: float = 0.0
 
-    def send_email(self, recipient_email: str, subject: str, body: str) -> None:
+    def build_request(self, recipient_email: str, subject: str, body: str) -> EmailRequest:
         api_url: str = current_app.config.get("EMAIL_API_URL")
         api_key: str = current_app.config.get("EMAIL_API_KEY")
 
+        return EmailRequest(
+            url=api_url,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+            },
+            json={
+                "from": "noreply@yourapp.com",
+                "to": recipient_email,
+                "subject": subject,
+                "body": body,
+            },
+        )
+
+    def send_email(self, recipient_email: str, subject: str, body: str) -> None:
         if current_app.debug and self.EMAIL_SEND_ARTIFICIAL_DELAY > 0:
             current_app.logger.info(
                 f"Artificial delay of {self.EMAIL_SEND_ARTIFICIAL_DELAY}s before sending email to {recipient_email}"
@@ -29,135 +277,227 @@ class LocalEmailSender(EmailSender):
         current_app.logger.info(
             f"Sending email to {recipient_email} with subject '{subject}'"
         )
-
-        payload: Dict[str, Any] = {
-            "from": "noreply@yourapp.com",
-            "to": recipient_email,
-            "subject": subject,
-            "body": body,
-        }
-
-        headers: Dict[str, str] = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        }
-
-        response = requests.post(api_url, json=payload, headers=headers)
-        current_app.logger.info(
-            f"Email send response status: {response.status_code} for {recipient_email}"
-        )
-        response.raise_for_status()
+        super().send_email(recipient_email, subject, body)
 
 
 class SendGridEmailSender(EmailSender):
-    def send_email(self, recipient_email: str, subject: str, body: str) -> None:
+    provider = "sendgrid"
+    max_batch_size = 1000
+
+    def build_request(self, recipient_email: str, subject: str, body: str) -> EmailRequest:
         api_url: str = current_app.config.get("EMAIL_API_URL")
         api_key: str = current_app.config.get("EMAIL_API_KEY")
 
-        sandbox_recipient = current_app.config.get("EMAIL_SANDBOX_RECIPIENT")
-        if sandbox_recipient:
-            current_app.logger.info(
-                f"[SendGrid] Sandbox mode active. Overriding recipient {recipient_email} -> {sandbox_recipient}"
-            )
-            recipient_email = sandbox_recipient
-
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        }
-
-        data = {
-            "personalizations": [{"to": [{"email": recipient_email}]}],
-            "from": {"email": "noreply@yourapp.com"},
-            "subject": subject,
-            "content": [{"type": "text/html", "value": body}],
-        }
-
-        response = requests.post(api_url, headers=headers, json=data)
+        return EmailRequest(
+            url=api_url,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+            },
+            json={
+                "personalizations": [
+                    {"to": [{"email": self.get_recipient(recipient_email)}]}
+                ],
+                "from": {"email": "noreply@yourapp.com"},
+                "subject": subject,
+                "content": [{"type": "text/html", "value": body}],
+            },
+        )
 
-        current_app.logger.info(
-            f"[SendGrid] Sent email to {recipient_email}, status: {response.status_code}"
+    def send_batch_chunk(
+        self,
+        subject: str,
+        body: Union[str, CompiledTemplate],
+        recipients: List[BatchRecipient],
+    ) -> List[Optional[Exception]]:
+        # One personalization per recipient, with its own substitutions
+        email_request = self.build_request("", subject, with_recipient_placeholders(body))
+        email_request.json["personalizations"] = [
+            {
+                "to": [{"email": recipient.email}],
+                "substitutions": {
+                    recipient_placeholder(name): value
+                    for name, value in recipient.variables.items()
+                },
+            }
+            for recipient in recipients
+        ]
+        response = self.post(
+            email_request.url, headers=email_request.headers, json=email_request.json
         )
         response.raise_for_status()
+        return [None] * len(recipients)
 
 
 class MailgunEmailSender(EmailSender):
-    def send_email(self, recipient_email: str, subject: str, body: str) -> None:
+    provider = "mailgun"
+    max_batch_size = 1000
+
+    def build_request(self, recipient_email: str, subject: str, body: str) -> EmailRequest:
         api_url: str = current_app.config.get("EMAIL_API_URL")
         api_key: str = current_app.config.get("EMAIL_API_KEY")
 
-        sandbox_recipient: Optional[str] = current_app.config.get(
-            "EMAIL_SANDBOX_RECIPIENT"
+        return EmailRequest(
+            url=api_url,
+            auth=("api", api_key),
+            data={
+                "from": "noreply@yourapp.com",
+                "to": self.get_recipient(recipient_email),
+                "subject": subject,
+                "html": body,
+            },
         )
-        if sandbox_recipient:
-            current_app.logger.info(
-                f"[Mailgun] Sandbox mode active. Overriding recipient {recipient_email} -> {sandbox_recipient}"
-            )
-            recipient_email = sandbox_recipient
-
-        auth = ("api", api_key)
-        data = {
-            "from": "noreply@yourapp.com",
-            "to": recipient_email,
-            "subject": subject,
-            "html": body,
-        }
 
-        response = requests.post(api_url, auth=auth, data=data)
-        current_app.logger.info(
-            f"[Mailgun] Sent email to {recipient_email}, status: {response.status_code}"
+    def send_batch_chunk(
+        self,
+        subject: str,
+        body: Union[str, CompiledTemplate],
+        recipients: List[BatchRecipient],
+    ) -> List[Optional[Exception]]:
+        # Recipient variables make Mailgun send each "to" address its own copy
+        email_request = self.build_request("", subject, with_recipient_placeholders(body))
+        email_request.data["to"] = [recipient.email for recipient in recipients]
+        email_request.data["recipient-variables"] = json.dumps(
+            {recipient.email: recipient.variables for recipient in recipients}
+        )
+        response = self.post(
+            email_request.url, auth=email_request.auth, data=email_request.data
         )
         response.raise_for_status()
+        return [None] * len(recipients)
 
 
 class PostmarkEmailSender(EmailSender):
-    def send_email(self, recipient_email: str, subject: str, body: str) -> None:
+    provider = "postmark"
+    max_batch_size = 500
+
+    def build_request(self, recipient_email: str, subject: str, body: str) -> EmailRequest:
         api_url: str = current_app.config.get("EMAIL_API_URL")
         api_key: str = current_app.config.get("EMAIL_API_KEY")
 
-        sandbox_recipient: Optional[str] = current_app.config.get(
-            "EMAIL_SANDBOX_RECIPIENT"
+        return EmailRequest(
+            url=api_url,
+            headers={
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+                "X-Postmark-Server-Token": api_key,
+            },
+            json={
+                "From": "noreply@yourapp.com",
+                "To": self.get_recipient(recipient_email),
+                "Subject": subject,
+                "HtmlBody": body,
+            },
         )
-        if sandbox_recipient:
-            current_app.logger.info(
-                f"[Postmark] Sandbox mode active. Overriding recipient {recipient_email} -> {sandbox_recipient}"
+
+    def send_batch_chunk(
+        self,
+        subject: str,
+        body: Union[str, CompiledTemplate],
+        recipients: List[BatchRecipient],
+    ) -> List[Optional[Exception]]:
+        # /email/batch takes fully rendered messages and reports on each one
+        email_request = self.build_request("", subject, "")
+        batch_url: str = current_app.config.get(
+            "EMAIL_BATCH_API_URL", f"{email_request.url.rstrip('/')}/batch"
+        )
+        messages = []
+        for recipient in recipients:
+            message = dict(email_request.json)
+            message["To"] = recipient.email
+            message["HtmlBody"] = render_recipient_body(body, recipient.variables)
+            messages.append(message)
+
+        response = self.post(batch_url, headers=email_request.headers, json=messages)
+        response.raise_for_status()
+        return [
+            None
+            if result.get("ErrorCode") == 0
+            else EmailSendError(
+                f"Postmark error {result.get('ErrorCode')}: {result.get('Message')}"
             )
-            recipient_email = sandbox_recipient
+            for result in response.json()
+        ]
 
-        headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "X-Postmark-Server-Token": api_key,
-        }
 
-        payload = {
-            "From": "noreply@yourapp.com",
-            "To": recipient_email,
-            "Subject": subject,
-            "HtmlBody": body,
-        }
+EMAIL_SENDERS = {
+    "sendgrid": SendGridEmailSender,
+    "mailgun": MailgunEmailSender,
+    "postmark": PostmarkEmailSender,
+}
 
-        response = requests.post(api_url, headers=headers, json=payload)
-        current_app.logger.info(
-            f"[Postmark] Sent email to {recipient_email}, status: {response.status_code}"
-        )
-        response.raise_for_status()
+
+def get_provider_rate_limiter(provider: str) -> Optional[ProviderRateLimiter]:
+    rate_limits = {
+        **DEFAULT_PROVIDER_RATE_LIMITS,
+        **current_app.config.get("EMAIL_PROVIDER_RATE_LIMITS", {}),
+    }
+    rate = float(rate_limits.get(provider, 0))
+    if rate <= 0:
+        return None
+    burst = current_app.config.get("EMAIL_RATE_LIMIT_BURST")
+    return ProviderRateLimiter(
+        db.engine, provider, rate, float(burst) if burst is not None else None
+    )
+
+
+# One sender per provider, owned by the process that created it
+_email_senders: Dict[str, EmailSender] = {}
+_email_senders_pid: Optional[int] = None
+_email_senders_lock = threading.Lock()
 
 
 def get_email_sender() -> EmailSender:
+    global _email_senders_pid
+
     email_provider: str = current_app.config.get("EMAIL_PROVIDER").lower()
 
-    if email_provider == "sendgrid":
-        return SendGridEmailSender()
-    elif email_provider == "mailgun":
-        return MailgunEmailSender()
-    elif email_provider == "postmark":
-        return PostmarkEmailSender()
-    else:
-        return LocalEmailSender()
+    with _email_senders_lock:
+        # Sockets must not be shared with a forked parent
+        if _email_senders_pid != os.getpid():
+            _email_senders.clear()
+            _email_senders_pid = os.getpid()
+
+        email_sender = _email_senders.get(email_provider)
+        if email_sender is None:
+            sender_class = EMAIL_SENDERS.get(email_provider, LocalEmailSender)
+            email_sender = sender_class(
+                pool_size=int(current_app.config.get("EMAIL_HTTP_POOL_SIZE", 10)),
+                timeout=(
+                    float(current_app.config.get("EMAIL_HTTP_CONNECT_TIMEOUT", 5)),
+                    float(current_app.config.get("EMAIL_HTTP_READ_TIMEOUT", 30)),
+                ),
+                rate_limiter=get_provider_rate_limiter(sender_class.provider),
+                max_throttle_retries=int(
+                    current_app.config.get("EMAIL_THROTTLE_MAX_RETRIES", 3)
+                ),
+                max_throttle_wait=float(
+                    current_app.config.get("EMAIL_THROTTLE_MAX_WAIT", 60)
+                ),
+            )
+            _email_senders[email_provider] = email_sender
+
+        return email_sender
+
+
+def get_email_sender_stats() -> List[Dict[str, Any]]:
+    with _email_senders_lock:
+        if _email_senders_pid != os.getpid():
+            return []
+        return [email_sender.stats() for email_sender in _email_senders.values()]
 
 
 __all__ = [
+    "EmailRequest",
+    "BatchRecipient",
+    "EmailSendError",
+    "RETRYABLE_STATUS_CODES",
+    "is_retryable_email_error",
+    "recipient_placeholder",
+    "render_recipient_body",
+    "with_recipient_placeholders",
     "EmailSender",
+    "get_provider_rate_limiter",
     "get_email_sender",
+    "get_email_sender_stats",
 ]
@@ -0,0 +1,57 @@
+import signal
+import threading
+
+from flask import Flask
+
+from .db import db
+from .email import dispatch_email_tasks, get_email_worker_id
+
+
+def run_email_worker(
+    app: Flask,
+    batch_size: int = 100,
+    poll_interval: float = 2.0,
+    once: bool = False,
+    concurrency: int = 1,
+) -> int:
+    # Stop after the current batch on SIGTERM/SIGINT; unfinished leases expire
+    # and the tasks are picked up by another replica
+    stopping = threading.Event()
+
+    def stop(signum, frame):
+        app.logger.info(f"Email worker received signal {signum}, stopping")
+        stopping.set()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    worker_id = get_email_worker_id()
+    app.logger.info(f"Email worker {worker_id} started")
+
+    processed = 0
+    while not stopping.is_set():
+        with app.app_context():
+            try:
+                claimed = dispatch_email_tasks(
+                    worker_id, batch_size, concurrency=concurrency
+                )
+            except Exception as e:
+                db.session.rollback()
+                app.logger.error(f"Email worker {worker_id} failed a batch: {e}")
+                claimed = 0
+            finally:
+                db.session.remove()
+
+        processed += claimed
+        if claimed:
+            app.logger.info(f"Email worker {worker_id} processed {claimed} email tasks")
+        elif once:
+            break
+        else:
+            stopping.wait(poll_interval)
+
+    app.logger.info(f"Email worker {worker_id} stopped after {processed} email tasks")
+    return processed
+
+
+__all__ = ["run_email_worker"]
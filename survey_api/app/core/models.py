@@ -3,7 +3,21 @@ import uuid
 import secrets
 from datetime import datetime, timezone
 
-from sqlalchemy import String, DateTime, UUID, Boolean, Text, Enum, ForeignKey
+from sqlalchemy import (
+    String,
+    DateTime,
+    UUID,
+    Boolean,
+    Text,
+    Enum,
+    ForeignKey,
+    Integer,
+    Float,
+    Computed,
+    Index,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .db import db
@@ -21,15 +35,41 @@ class SurveyAnswer(enum.Enum):
 
 
 class Survey(db.Model):
+    __table_args__ = (
+        Index(
+            "ix_survey_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index("ix_survey_question_tsv", "question_tsv", postgresql_using="gin"),
+        Index("ix_survey_owner_id_created_at", "owner_id", "created_at", "id"),
+        Index(
+            "ix_survey_active_end_date",
+            "end_date",
+            postgresql_where=text("status = 'ACTIVE'"),
+        ),
+        Index(
+            "ix_survey_ended_email_pending",
+            "id",
+            postgresql_where=text("ended_email_pending"),
+        ),
+    )
+
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
-        unique=True,
         nullable=False,
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     question: Mapped[str] = mapped_column(Text, nullable=False)
+    question_tsv: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', question)", persisted=True),
+        nullable=True,
+        deferred=True,
+    )
     end_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     is_anonymous: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     owner_id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
@@ -37,14 +77,29 @@ class Survey(db.Model):
         Enum(SurveyStatus), default=SurveyStatus.ACTIVE.value, nullable=False
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.now(timezone.utc), nullable=False
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.now(timezone.utc),
-        onupdate=datetime.now(timezone.utc),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
         nullable=False,
     )
+    version: Mapped[int] = mapped_column(
+        Integer, default=1, server_default="1", nullable=False
+    )
+    # Set in the transaction that closes the survey and cleared by the job that
+    # sends the ended emails, so a job that was never run is retried
+    ended_email_pending: Mapped[bool] = mapped_column(
+        Boolean, default=False, server_default=text("false"), nullable=False
+    )
+    contact_list_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("contact_list.id", ondelete="SET NULL"),
+        nullable=True,
+    )
     responses = relationship(
         "SurveyResponse", back_populates="survey", cascade="all, delete-orphan"
     )
@@ -54,14 +109,37 @@ class Survey(db.Model):
     email_tasks = relationship(
         "EmailTask", back_populates="survey", cascade="all, delete-orphan"
     )
+    result_counter = relationship(
+        "SurveyResultCounter",
+        back_populates="survey",
+        cascade="all, delete-orphan",
+        uselist=False,
+    )
 
 
 class SurveyResponse(db.Model):
+    __table_args__ = (
+        # Serves the per-survey lookups and the keyset pages of the results
+        Index(
+            "ix_survey_response_survey_id_answered_at",
+            "survey_id",
+            "answered_at",
+            "id",
+        ),
+        # Anonymous responses have no email, so only named responses are unique
+        Index(
+            "uq_survey_response_survey_id_recipient_email",
+            "survey_id",
+            "recipient_email",
+            unique=True,
+            postgresql_where=text("recipient_email <> ''"),
+        ),
+    )
+
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
-        unique=True,
         nullable=False,
     )
     survey_id: Mapped[UUID] = mapped_column(
@@ -70,17 +148,35 @@ class SurveyResponse(db.Model):
     recipient_email: Mapped[str] = mapped_column(String(255), nullable=False)
     answer: Mapped[SurveyAnswer] = mapped_column(Enum(SurveyAnswer), nullable=False)
     answered_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.now(timezone.utc), nullable=False
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
     )
     survey = relationship("Survey", back_populates="responses")
 
 
+class SurveyResultCounter(db.Model):
+    __tablename__ = "survey_result_counters"
+
+    survey_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("survey.id"), primary_key=True
+    )
+    yes: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    no: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    cant_answer: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    survey = relationship("Survey", back_populates="result_counter")
+
+
 class Recipient(db.Model):
+    __table_args__ = (
+        Index("uq_recipient_survey_id_email", "survey_id", "email", unique=True),
+    )
+
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
-        unique=True,
         nullable=False,
     )
     survey_id: Mapped[UUID] = mapped_column(
@@ -96,6 +192,68 @@ class Recipient(db.Model):
     survey = relationship("Survey", back_populates="recipients_list")
 
 
+class RecipientTokenAlias(db.Model):
+    # Response tokens of duplicate recipients merged by the unique index
+    # migration. Their invites were already sent, so the links keep working
+    __tablename__ = "recipient_token_alias"
+
+    response_token: Mapped[str] = mapped_column(String(64), primary_key=True)
+    survey_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("survey.id", ondelete="CASCADE"), nullable=False
+    )
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
+
+
+class ContactList(db.Model):
+    __table_args__ = (Index("ix_contact_list_owner_id_created_at", "owner_id", "created_at"),)
+
+    id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+        nullable=False,
+    )
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    owner_id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    contacts = relationship(
+        "Contact",
+        back_populates="contact_list",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+
+class Contact(db.Model):
+    __table_args__ = (
+        Index("uq_contact_contact_list_id_email", "contact_list_id", "email", unique=True),
+    )
+
+    id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+        nullable=False,
+    )
+    contact_list_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("contact_list.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
+    contact_list = relationship("ContactList", back_populates="contacts")
+
+
 class EmailTaskStatus(enum.Enum):
     PENDING = "PENDING"
     SENT = "SENT"
@@ -103,11 +261,21 @@ class EmailTaskStatus(enum.Enum):
 
 
 class EmailTask(db.Model):
+    __table_args__ = (
+        Index("ix_email_task_survey_id_status", "survey_id", "status"),
+        # Pending tasks in the order they become due, for claiming
+        Index(
+            "ix_email_task_pending_next_attempt_at",
+            "next_attempt_at",
+            postgresql_ops={"next_attempt_at": "NULLS FIRST"},
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+    )
+
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
-        unique=True,
         nullable=False,
     )
     survey_id: Mapped[UUID] = mapped_column(
@@ -118,15 +286,38 @@ class EmailTask(db.Model):
         Enum(EmailTaskStatus), default=EmailTaskStatus.PENDING, nullable=False
     )
     sent_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Lease held by the worker currently sending this task
+    locked_until: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    locked_by: Mapped[str] = mapped_column(String(255), nullable=True)
+    # Failed sends are retried with backoff, FAILED once attempts run out
+    attempts: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    last_error: Mapped[str] = mapped_column(Text, nullable=True)
     survey = relationship("Survey", back_populates="email_tasks")
 
 
+class EmailRateLimit(db.Model):
+    # Token bucket per email provider, shared by every email worker
+    provider: Mapped[str] = mapped_column(String(64), primary_key=True)
+    tokens: Mapped[float] = mapped_column(Float, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
 __all__ = [
     "Survey",
     "SurveyStatus",
     "SurveyResponse",
     "SurveyAnswer",
+    "SurveyResultCounter",
     "Recipient",
+    "RecipientTokenAlias",
+    "ContactList",
+    "Contact",
     "EmailTask",
     "EmailTaskStatus",
+    "EmailRateLimit",
 ]
@@ -0,0 +1,59 @@
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Mapping, Optional, Tuple
+from uuid import UUID
+
+MAX_PAGE_SIZE = 100
+
+
+@dataclass
+class Cursor:
+    created_at: datetime
+    id: UUID
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    payload = json.dumps(
+        {"createdAt": cursor.created_at.isoformat(), "id": str(cursor.id)}
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(encoded_cursor: str) -> Optional[Cursor]:
+    try:
+        # Restore the padding stripped by encode_cursor
+        padding = "=" * (-len(encoded_cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(encoded_cursor + padding))
+
+        return Cursor(
+            created_at=datetime.fromisoformat(payload["createdAt"]),
+            id=UUID(payload["id"]),
+        )
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def parse_page_args(
+    args: Mapping[str, str], default_page_size: int = 20
+) -> Optional[Tuple[int, int]]:
+    # (page, page_size) from the query string, None when either is not a number
+    # in range
+    try:
+        page = int(args.get("page", 1))
+        page_size = int(args.get("pageSize", default_page_size))
+    except ValueError:
+        return None
+    if page < 1 or not 1 <= page_size <= MAX_PAGE_SIZE:
+        return None
+    return page, page_size
+
+
+__all__ = [
+    "MAX_PAGE_SIZE",
+    "parse_page_args",
+    "Cursor",
+    "encode_cursor",
+    "decode_cursor",
+]
@@ -0,0 +1,145 @@
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+
+from sqlalchemy import Engine, text
+
+# Requests per second each provider accepts by default (0 = no cap)
+DEFAULT_PROVIDER_RATE_LIMITS = {
+    "local": 0,
+    "sendgrid": 100,
+    "mailgun": 100,
+    "postmark": 50,
+}
+
+# Responses that mean "slow down" rather than "this email failed"
+THROTTLED_STATUS_CODES = (429, 503)
+
+# Refills the provider's bucket for the time since the last call and takes
+# :cost tokens from it. The balance may go negative: that is the queue of
+# requests already promised to other workers, so the caller waits until its
+# own tokens have been earned (or until a Retry-After block has passed)
+RESERVE_EMAIL_RATE_LIMIT_STATEMENT = text(
+    """
+    INSERT INTO email_rate_limit AS bucket (provider, tokens, updated_at)
+    VALUES (:provider, :burst - :cost, clock_timestamp())
+    ON CONFLICT (provider) DO UPDATE SET
+        tokens = least(
+            :burst,
+            bucket.tokens
+                + :rate * extract(epoch FROM clock_timestamp() - bucket.updated_at)
+        ) - :cost,
+        updated_at = clock_timestamp()
+    RETURNING greatest(-bucket.tokens / :rate, 0)
+    """
+)
+
+# Puts the bucket at least :seconds worth of tokens in debt, so every worker
+# holds off for the provider's Retry-After. Not additive, workers throttled at
+# the same time do not stack their delays
+BLOCK_EMAIL_RATE_LIMIT_STATEMENT = text(
+    """
+    UPDATE email_rate_limit AS bucket SET
+        tokens = least(
+            :burst,
+            bucket.tokens
+                + :rate * extract(epoch FROM clock_timestamp() - bucket.updated_at),
+            -:rate * :seconds
+        ),
+        updated_at = clock_timestamp()
+    WHERE bucket.provider = :provider
+    """
+)
+
+
+def get_throttle_delay(
+    status_code: int, headers: Mapping[str, str], default: float = 1.0
+) -> Optional[float]:
+    # Seconds to wait before retrying a throttled response, None if it was not
+    # throttled. Retry-After is either a number of seconds or an HTTP date
+    if status_code not in THROTTLED_STATUS_CODES:
+        return None
+    retry_after = headers.get("Retry-After")
+    if retry_after is None:
+        # A 503 without Retry-After is an outage, not throttling
+        return default if status_code == 429 else None
+
+    try:
+        return max(float(retry_after), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class ProviderRateLimiter:
+    """Token bucket for one email provider, shared by every worker through Postgres.
+
+    Allows `rate` requests per second with bursts of up to `burst`. Each call
+    is a single short transaction on its own connection, outside the caller's
+    session, so it never holds the bucket row while an email is being sent.
+    """
+
+    def __init__(
+        self, engine: Engine, provider: str, rate: float, burst: Optional[float] = None
+    ):
+        self.engine = engine
+        self.provider = provider
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(rate, 1))
+        self.waited = 0.0
+        self.blocked = 0
+
+    def _params(self, **params: float) -> Dict[str, Any]:
+        return {
+            "provider": self.provider,
+            "rate": self.rate,
+            "burst": self.burst,
+            **params,
+        }
+
+    def reserve(self, cost: float = 1) -> float:
+        # Takes the tokens now and returns how long to wait before using them
+        with self.engine.begin() as connection:
+            wait = connection.execute(
+                RESERVE_EMAIL_RATE_LIMIT_STATEMENT, self._params(cost=float(cost))
+            ).scalar_one()
+        wait = float(wait)
+        self.waited += wait
+        return wait
+
+    def acquire(self, cost: float = 1) -> None:
+        wait = self.reserve(cost)
+        if wait > 0:
+            time.sleep(wait)
+
+    def block(self, seconds: float) -> None:
+        with self.engine.begin() as connection:
+            connection.execute(
+                BLOCK_EMAIL_RATE_LIMIT_STATEMENT, self._params(seconds=float(seconds))
+            )
+        self.blocked += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "secondsWaited": round(self.waited, 3),
+            "blocked": self.blocked,
+        }
+
+
+__all__ = [
+    "DEFAULT_PROVIDER_RATE_LIMITS",
+    "THROTTLED_STATUS_CODES",
+    "RESERVE_EMAIL_RATE_LIMIT_STATEMENT",
+    "BLOCK_EMAIL_RATE_LIMIT_STATEMENT",
+    "get_throttle_delay",
+    "ProviderRateLimiter",
+]
@@ -1,8 +1,23 @@
-from datetime import datetime
-from typing import List, Optional, Dict, Tuple, Any, Union
+import enum
+import secrets
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import List, Optional, Dict, Tuple, Any, Union, Iterable, Iterator
 
+from flask import current_app
 from pydantic import UUID4, EmailStr, ValidationError
+from sqlalchemy import (
+    func,
+    select,
+    delete,
+    insert,
+    update,
+    text,
+    tuple_,
+    literal_column,
+)
 
+from .cache import public_survey_cache
 from .db import db
 from .models import (
     Survey,
@@ -11,16 +26,28 @@ from .models import (
     EmailTask,
     EmailTaskStatus,
     SurveyStatus,
+    SurveyResultCounter,
+    Recipient,
 )
+from .pagination import Cursor
 from .pydantic import PydanticBaseModel
-from .utils import close_expired_survey, run_concurrent_email_task
-from .email import send_survey_emails, send_survey_ended_email
+from .utils import get_effective_survey_status, run_concurrent_email_task
+from .email import (
+    dispatch_survey_emails,
+    reset_failed_email_tasks,
+    send_survey_emails,
+    send_survey_ended_email,
+)
+from .versioning import bump_survey_version
 
 
 class EmailTaskInfo(PydanticBaseModel):
     recipient: EmailStr
     status: str
     sentAt: Optional[datetime]
+    attempts: int
+    nextAttemptAt: Optional[datetime]
+    lastError: Optional[str]
 
 
 class EmailStatusSummary(PydanticBaseModel):
@@ -30,81 +57,560 @@ class EmailStatusSummary(PydanticBaseModel):
     total: int
 
 
+def _empty_survey_results() -> Dict[str, int]:
+    return {
+        SurveyAnswer.YES.value: 0,
+        SurveyAnswer.NO.value: 0,
+        SurveyAnswer.CANT_ANSWER.value: 0,
+    }
+
+
+def get_email_status_summaries(
+    survey_ids: Iterable[UUID4],
+) -> Dict[UUID4, EmailStatusSummary]:
+    survey_ids = list(survey_ids)
+    summaries = {
+        survey_id: EmailStatusSummary(sent=0, pending=0, failed=0, total=0)
+        for survey_id in survey_ids
+    }
+    if not survey_ids:
+        return summaries
+
+    # Count every status for the whole page in a single grouped query
+    rows = db.session.execute(
+        select(
+            EmailTask.survey_id,
+            func.count().filter(EmailTask.status == EmailTaskStatus.SENT),
+            func.count().filter(EmailTask.status == EmailTaskStatus.PENDING),
+            func.count().filter(EmailTask.status == EmailTaskStatus.FAILED),
+            func.count(),
+        )
+        .where(EmailTask.survey_id.in_(survey_ids))
+        .group_by(EmailTask.survey_id)
+    ).all()
+    for survey_id, sent, pending, failed, total in rows:
+        summaries[survey_id] = EmailStatusSummary(
+            sent=sent, pending=pending, failed=failed, total=total
+        )
+
+    return summaries
+
+
 def get_email_status_summary(survey_id: UUID4) -> EmailStatusSummary:
-    email_tasks = EmailTask.query.filter_by(survey_id=survey_id).all()
-    sent = sum(
-        1 for email_task in email_tasks if email_task.status == EmailTaskStatus.SENT
-    )
-    pending = sum(
-        1 for email_task in email_tasks if email_task.status == EmailTaskStatus.PENDING
-    )
-    failed = sum(
-        1 for email_task in email_tasks if email_task.status == EmailTaskStatus.FAILED
-    )
+    return get_email_status_summaries([survey_id])[survey_id]
 
-    return EmailStatusSummary(
-        sent=sent,
-        pending=pending,
-        failed=failed,
-        total=len(email_tasks),
-    )
 
+def get_email_tasks_info(
+    survey_id: UUID4,
+    status: Optional[EmailTaskStatus] = None,
+    page: int = 1,
+    page_size: int = 20,
+) -> Tuple[List[EmailTaskInfo], int]:
+    query = EmailTask.query.filter_by(survey_id=survey_id)
+    if status:
+        query = query.filter_by(status=status)
+
+    total = query.count()
+    email_tasks = (
+        query.order_by(EmailTask.recipient_email, EmailTask.id)
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+        .all()
+    )
 
-def get_email_tasks_info(survey_id: UUID4) -> List[EmailTaskInfo]:
-    email_tasks = EmailTask.query.filter_by(survey_id=survey_id).all()
     return [
         EmailTaskInfo(
             recipient=email_task.recipient_email,
-            status=email_task.status,
+            status=email_task.status.value,
             sentAt=email_task.sent_at,
+            attempts=email_task.attempts,
+            nextAttemptAt=email_task.next_attempt_at,
+            lastError=email_task.last_error,
         )
         for email_task in email_tasks
-    ]
+    ], total
 
 
-def get_survey_results(survey: Survey) -> Tuple[Dict[str, int], List[str]]:
-    results = {
-        SurveyAnswer.YES.value: 0,
-        SurveyAnswer.NO.value: 0,
-        SurveyAnswer.CANT_ANSWER.value: 0,
-    }
-    respondent_emails = []
-
-    for response in SurveyResponse.query.filter_by(survey_id=survey.id).all():
-        answer = response.answer.value
-        if answer in results:
-            results[answer] += 1
-        if not survey.is_anonymous:
-            respondent_emails.append(response.recipient_email)
-
-    return results, respondent_emails
-
-
-def get_detailed_responses(survey: Survey) -> List[Dict]:
-    responses = []
-    for response in SurveyResponse.query.filter_by(survey_id=survey.id).all():
-        answer = response.answer.value
-        if survey.is_anonymous:
-            responses.append(
-                {
-                    "respondentEmail": None,
-                    "answer": answer,
-                    "answeredAt": response.answered_at,
-                }
-            )
+def get_recipient_emails(
+    survey_id: UUID4, page: int = 1, page_size: int = 20
+) -> Tuple[List[str], int]:
+    query = select(Recipient.email).where(Recipient.survey_id == survey_id)
+
+    total = db.session.scalar(select(func.count()).select_from(query.subquery()))
+    recipient_emails = db.session.scalars(
+        query.order_by(Recipient.email, Recipient.id)
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+    ).all()
+
+    return list(recipient_emails), total
+
+
+def get_respondent_emails(
+    survey_id: UUID4, page: int = 1, page_size: int = 20
+) -> Tuple[List[str], int]:
+    query = select(SurveyResponse.recipient_email).where(
+        SurveyResponse.survey_id == survey_id
+    )
+
+    total = db.session.scalar(select(func.count()).select_from(query.subquery()))
+    respondent_emails = db.session.scalars(
+        query.order_by(SurveyResponse.answered_at, SurveyResponse.id)
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+    ).all()
+
+    return list(respondent_emails), total
+
+
+def get_surveys_recipient_counts(
+    survey_ids: Iterable[UUID4],
+) -> Dict[UUID4, int]:
+    survey_ids = list(survey_ids)
+    recipient_counts = {survey_id: 0 for survey_id in survey_ids}
+    if not survey_ids:
+        return recipient_counts
+
+    rows = db.session.execute(
+        select(Recipient.survey_id, func.count())
+        .where(Recipient.survey_id.in_(survey_ids))
+        .group_by(Recipient.survey_id)
+    ).all()
+    for survey_id, count in rows:
+        recipient_counts[survey_id] = count
+
+    return recipient_counts
+
+
+def normalize_recipient_email(email: str) -> str:
+    return email.strip().lower()
+
+
+def normalize_recipient_emails(emails: Iterable[str]) -> List[str]:
+    # Lowercase and de-duplicate while keeping the original order
+    return list(dict.fromkeys(normalize_recipient_email(email) for email in emails))
+
+
+def add_survey_recipients(survey_id: UUID4, emails: List[str]) -> None:
+    if not emails:
+        return
+
+    # Multi-row inserts; the caller owns the transaction
+    db.session.execute(
+        insert(Recipient),
+        [{"survey_id": survey_id, "email": email} for email in emails],
+    )
+    db.session.execute(
+        insert(EmailTask),
+        [{"survey_id": survey_id, "recipient_email": email} for email in emails],
+    )
+
+
+# Moves the staged upload into recipient and email_task, skipping addresses the
+# survey already has (also when a concurrent upload adds them first) and keeping
+# the first occurrence of repeated ones
+LOAD_SURVEY_RECIPIENTS_STATEMENT = text(
+    """
+    WITH staged AS (
+        SELECT DISTINCT ON (email) position, email, response_token
+        FROM recipient_upload
+        ORDER BY email, position
+    ),
+    new_recipients AS (
+        INSERT INTO recipient (id, survey_id, email, response_token)
+        SELECT gen_random_uuid(), CAST(:survey_id AS uuid), email, response_token
+        FROM staged
+        ORDER BY position
+        ON CONFLICT (survey_id, email) DO NOTHING
+        RETURNING email
+    ),
+    new_tasks AS (
+        INSERT INTO email_task (id, survey_id, recipient_email, status)
+        SELECT
+            gen_random_uuid(),
+            CAST(:survey_id AS uuid),
+            email,
+            CAST('PENDING' AS emailtaskstatus)
+        FROM new_recipients
+        RETURNING 1
+    )
+    SELECT COUNT(*) FROM new_tasks
+    """
+)
+
+
+def load_survey_recipients(survey_id: UUID4, emails: Iterable[str]) -> int:
+    # Stream the addresses into a temporary table with COPY, then insert the new
+    # ones set-based; the caller owns the transaction
+    cursor = db.session.connection().connection.cursor()
+    try:
+        cursor.execute(
+            "CREATE TEMP TABLE recipient_upload "
+            "(position bigint, email text, response_token text) ON COMMIT DROP"
+        )
+        with cursor.copy(
+            "COPY recipient_upload (position, email, response_token) FROM STDIN"
+        ) as copy:
+            for position, email in enumerate(emails):
+                copy.write_row((position, email, secrets.token_urlsafe(32)))
+
+        added = db.session.execute(
+            LOAD_SURVEY_RECIPIENTS_STATEMENT, {"survey_id": str(survey_id)}
+        ).scalar_one()
+        cursor.execute("DROP TABLE recipient_upload")
+    finally:
+        cursor.close()
+
+    return added
+
+
+SURVEY_RESULT_COUNTER_COLUMNS = {
+    SurveyAnswer.YES.value: "yes",
+    SurveyAnswer.NO.value: "no",
+    SurveyAnswer.CANT_ANSWER.value: "cant_answer",
+}
+
+
+class SurveyResponseOutcome(enum.Enum):
+    RECORDED = "RECORDED"
+    DUPLICATE = "DUPLICATE"
+    INVALID_TOKEN = "INVALID_TOKEN"
+    SURVEY_CLOSED = "SURVEY_CLOSED"
+
+
+@dataclass(frozen=True)
+class SurveyResponseSubmission:
+    survey_id: UUID4
+    answer: str
+    token: Optional[str] = None
+    email: Optional[str] = None
+    answered_at: Optional[datetime] = None
+
+
+# Takes the row locks of every survey in a batch up front, in id order, so two
+# batches touching the same surveys queue up instead of deadlocking on the
+# counter and version rows
+LOCK_RESPONSE_SURVEYS_STATEMENT = text(
+    """
+    SELECT id FROM survey
+    WHERE id = ANY(CAST(:survey_ids AS uuid[]))
+    ORDER BY id
+    FOR NO KEY UPDATE
+    """
+)
+
+# Validates the surveys and tokens, inserts the responses, and updates the result
+# counters and survey versions, all in one statement so concurrent double
+# submissions are resolved by the unique index instead of a racy SELECT
+RECORD_SURVEY_RESPONSES_STATEMENT = text(
+    """
+    WITH input AS (
+        SELECT *
+        FROM unnest(
+            CAST(:survey_ids AS uuid[]),
+            CAST(:answers AS text[]),
+            CAST(:tokens AS text[]),
+            CAST(:emails AS text[]),
+            CAST(:answered_ats AS timestamptz[])
+        ) WITH ORDINALITY AS input(survey_id, answer, token, email, answered_at, ord)
+    ),
+    target AS (
+        SELECT
+            input.ord,
+            input.answer,
+            input.answered_at,
+            s.id AS survey_id,
+            CASE
+                WHEN input.token IS NULL THEN COALESCE(input.email, '')
+                ELSE COALESCE(r.email, alias.email)
+            END AS recipient_email
+        FROM input
+        JOIN survey AS s
+            ON s.id = input.survey_id
+           AND CASE
+               WHEN input.answered_at IS NULL
+                   THEN s.status = 'ACTIVE' AND s.end_date > now()
+               -- Imported answers count if they were given before the end
+               -- date. A survey terminated early has no recorded close time,
+               -- so it takes no imports until its end date has passed
+               ELSE input.answered_at < s.end_date
+                   AND (s.status = 'ACTIVE' OR s.end_date <= now())
+           END
+        LEFT JOIN recipient AS r
+            ON r.survey_id = s.id AND r.response_token = input.token
+        LEFT JOIN recipient_token_alias AS alias
+            ON r.email IS NULL
+           AND alias.survey_id = s.id
+           AND alias.response_token = input.token
+    ),
+    valid AS (
+        SELECT
+            *,
+            MIN(ord) OVER (PARTITION BY survey_id, recipient_email) AS first_ord
+        FROM target
+        WHERE recipient_email IS NOT NULL
+    ),
+    inserted AS (
+        INSERT INTO survey_response (id, survey_id, recipient_email, answer, answered_at)
+        SELECT
+            gen_random_uuid(),
+            survey_id,
+            recipient_email,
+            CAST(answer AS surveyanswer),
+            COALESCE(answered_at, now())
+        FROM valid
+        WHERE recipient_email = '' OR ord = first_ord
+        ORDER BY ord
+        ON CONFLICT (survey_id, recipient_email) WHERE recipient_email <> '' DO NOTHING
+        RETURNING survey_id, recipient_email, answer
+    ),
+    counted AS (
+        INSERT INTO survey_result_counters (survey_id, yes, no, cant_answer, total)
+        SELECT
+            survey_id,
+            COUNT(*) FILTER (WHERE answer = 'YES'),
+            COUNT(*) FILTER (WHERE answer = 'NO'),
+            COUNT(*) FILTER (WHERE answer = 'CANT_ANSWER'),
+            COUNT(*)
+        FROM inserted
+        GROUP BY survey_id
+        ORDER BY survey_id
+        ON CONFLICT (survey_id) DO UPDATE SET
+            yes = survey_result_counters.yes + EXCLUDED.yes,
+            no = survey_result_counters.no + EXCLUDED.no,
+            cant_answer = survey_result_counters.cant_answer + EXCLUDED.cant_answer,
+            total = survey_result_counters.total + EXCLUDED.total
+    ),
+    bumped AS (
+        UPDATE survey SET version = version + 1
+        WHERE id IN (SELECT survey_id FROM inserted)
+    )
+    SELECT
+        target.ord IS NOT NULL AS is_open,
+        valid.ord IS NOT NULL AS is_valid,
+        valid.ord IS NOT NULL
+            AND (valid.recipient_email = '' OR valid.ord = valid.first_ord)
+            AND EXISTS (
+                SELECT 1 FROM inserted
+                WHERE inserted.survey_id = valid.survey_id
+                  AND inserted.recipient_email = valid.recipient_email
+            ) AS is_inserted
+    FROM input
+    LEFT JOIN target ON target.ord = input.ord
+    LEFT JOIN valid ON valid.ord = input.ord
+    ORDER BY input.ord
+    """
+)
+
+
+def record_survey_responses(
+    submissions: List[SurveyResponseSubmission],
+) -> List[SurveyResponseOutcome]:
+    if not submissions:
+        return []
+
+    survey_ids = [str(submission.survey_id) for submission in submissions]
+    db.session.execute(
+        LOCK_RESPONSE_SURVEYS_STATEMENT, {"survey_ids": sorted(set(survey_ids))}
+    )
+    rows = db.session.execute(
+        RECORD_SURVEY_RESPONSES_STATEMENT,
+        {
+            "survey_ids": survey_ids,
+            "answers": [submission.answer for submission in submissions],
+            "tokens": [submission.token for submission in submissions],
+            # Same rule as recipients, so a response matches its recipient row
+            "emails": [
+                normalize_recipient_email(submission.email)
+                if submission.email is not None
+                else None
+                for submission in submissions
+            ],
+            "answered_ats": [submission.answered_at for submission in submissions],
+        },
+    ).all()
+    db.session.commit()
+
+    outcomes = []
+    for is_open, is_valid, is_inserted in rows:
+        if not is_open:
+            outcomes.append(SurveyResponseOutcome.SURVEY_CLOSED)
+        elif not is_valid:
+            outcomes.append(SurveyResponseOutcome.INVALID_TOKEN)
+        elif not is_inserted:
+            outcomes.append(SurveyResponseOutcome.DUPLICATE)
         else:
-            responses.append(
-                {
-                    "respondentEmail": response.recipient_email,
-                    "answer": answer,
-                    "answeredAt": response.answered_at,
-                }
-            )
-    return responses
+            outcomes.append(SurveyResponseOutcome.RECORDED)
+
+    return outcomes
+
+
+def record_survey_response(
+    survey_id: UUID4,
+    answer: str,
+    token: Optional[str] = None,
+    email: Optional[str] = None,
+) -> SurveyResponseOutcome:
+    return record_survey_responses(
+        [SurveyResponseSubmission(survey_id, answer, token=token, email=email)]
+    )[0]
+
+
+def rebuild_survey_result_counters(
+    survey_ids: Optional[Iterable[UUID4]] = None,
+) -> int:
+    # Recount the responses from scratch to repair any drift in the counters
+    delete_statement = delete(SurveyResultCounter)
+    count_query = select(
+        SurveyResponse.survey_id,
+        func.count().filter(SurveyResponse.answer == SurveyAnswer.YES),
+        func.count().filter(SurveyResponse.answer == SurveyAnswer.NO),
+        func.count().filter(SurveyResponse.answer == SurveyAnswer.CANT_ANSWER),
+        func.count(),
+    ).group_by(SurveyResponse.survey_id)
+    # Repaired counts change the results, so cached copies must be invalidated
+    version_statement = update(Survey).values(
+        version=Survey.version + 1, updated_at=Survey.updated_at
+    )
+    if survey_ids is not None:
+        survey_ids = list(survey_ids)
+        delete_statement = delete_statement.where(
+            SurveyResultCounter.survey_id.in_(survey_ids)
+        )
+        count_query = count_query.where(SurveyResponse.survey_id.in_(survey_ids))
+        version_statement = version_statement.where(Survey.id.in_(survey_ids))
+
+    db.session.execute(delete_statement)
+    db.session.execute(version_statement)
+    result = db.session.execute(
+        insert(SurveyResultCounter).from_select(
+            ["survey_id", "yes", "no", "cant_answer", "total"], count_query
+        )
+    )
+    db.session.commit()
+
+    return result.rowcount
+
+
+def get_surveys_result_counts(
+    survey_ids: Iterable[UUID4],
+) -> Dict[UUID4, Dict[str, int]]:
+    survey_ids = list(survey_ids)
+    result_counts = {survey_id: _empty_survey_results() for survey_id in survey_ids}
+    if not survey_ids:
+        return result_counts
+
+    # Read the maintained counters instead of scanning every response
+    counters = db.session.scalars(
+        select(SurveyResultCounter).where(
+            SurveyResultCounter.survey_id.in_(survey_ids)
+        )
+    ).all()
+    for counter in counters:
+        result_counts[counter.survey_id] = {
+            answer: getattr(counter, column)
+            for answer, column in SURVEY_RESULT_COUNTER_COLUMNS.items()
+        }
+
+    return result_counts
+
+
+def _format_detailed_response(
+    survey: Survey, recipient_email: str, answer: SurveyAnswer, answered_at: datetime
+) -> Dict:
+    return {
+        "respondentEmail": None if survey.is_anonymous else recipient_email,
+        "answer": answer.value,
+        "answeredAt": answered_at,
+    }
 
 
-def check_and_update_survey_status(survey: Survey) -> None:
-    close_expired_survey(survey)
+def iter_detailed_responses(
+    survey: Survey, batch_size: int = 1000
+) -> Iterator[Dict]:
+    # Stream the responses through a server-side cursor instead of loading them all
+    rows = db.session.execute(
+        select(
+            SurveyResponse.recipient_email,
+            SurveyResponse.answer,
+            SurveyResponse.answered_at,
+        )
+        .where(SurveyResponse.survey_id == survey.id)
+        .order_by(SurveyResponse.answered_at, SurveyResponse.id)
+        .execution_options(yield_per=batch_size)
+    )
+    for recipient_email, answer, answered_at in rows:
+        yield _format_detailed_response(survey, recipient_email, answer, answered_at)
+
+
+def get_detailed_responses_page(
+    survey: Survey, page_size: int = 20, after: Optional[Cursor] = None
+) -> Tuple[List[Dict], Optional[Cursor]]:
+    # One keyset page in answer order, walked through the (survey_id,
+    # answered_at, id) index. The cursor's created_at holds the answered_at of
+    # the last response of the previous page
+    query = select(
+        SurveyResponse.id,
+        SurveyResponse.recipient_email,
+        SurveyResponse.answer,
+        SurveyResponse.answered_at,
+    ).where(SurveyResponse.survey_id == survey.id)
+    if after is not None:
+        query = query.where(
+            tuple_(SurveyResponse.answered_at, SurveyResponse.id)
+            > (after.created_at, after.id)
+        )
+
+    # Fetch one extra row to know whether there is a next page
+    rows = db.session.execute(
+        query.order_by(SurveyResponse.answered_at, SurveyResponse.id).limit(
+            page_size + 1
+        )
+    ).all()
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = Cursor(created_at=rows[-1].answered_at, id=rows[-1].id)
+
+    responses = [
+        _format_detailed_response(survey, recipient_email, answer, answered_at)
+        for _, recipient_email, answer, answered_at in rows
+    ]
+    return responses, next_cursor
+
+
+def get_daily_response_counts(survey_id: UUID4) -> List[Dict]:
+    # Aggregated by Postgres, one row per UTC day instead of every response. The
+    # zone is a literal so SELECT and GROUP BY stay the same expression
+    day = func.date(
+        func.timezone(literal_column("'UTC'"), SurveyResponse.answered_at)
+    )
+    rows = db.session.execute(
+        select(day, func.count())
+        .where(SurveyResponse.survey_id == survey_id)
+        .group_by(day)
+        .order_by(day)
+    ).all()
+    return [{"date": str(date), "count": count} for date, count in rows]
+
+
+def search_surveys(query: Any, search: str, search_question: bool = False) -> Any:
+    # Substring match on the name is served by the pg_trgm GIN index
+    name_match = Survey.name.icontains(search, autoescape=True)
+    rank = func.similarity(Survey.name, search)
+    if search_question:
+        # Full-text match on the question is served by the tsvector GIN index
+        ts_query = func.plainto_tsquery("simple", search)
+        query = query.filter(name_match | Survey.question_tsv.op("@@")(ts_query))
+        rank = rank + func.ts_rank(Survey.question_tsv, ts_query)
+    else:
+        query = query.filter(name_match)
+
+    return query.order_by(rank.desc(), Survey.created_at.desc(), Survey.id.desc())
+
+
+def get_survey_status(survey: Any) -> SurveyStatus:
+    return get_effective_survey_status(survey)
 
 
 def get_survey_by_id(
@@ -116,10 +622,60 @@ def get_survey_by_id(
     return survey, None
 
 
+@dataclass(frozen=True)
+class PublicSurveyInfo:
+    id: UUID4
+    name: str
+    question: str
+    end_date: datetime
+    is_anonymous: bool
+    status: SurveyStatus
+    created_at: datetime
+    updated_at: datetime
+    version: int
+
+    @property
+    def is_expired(self) -> bool:
+        return self.status == SurveyStatus.ACTIVE and self.end_date <= datetime.now(
+            timezone.utc
+        )
+
+    @property
+    def effective_status(self) -> SurveyStatus:
+        return SurveyStatus.CLOSED if self.is_expired else self.status
+
+
+def get_public_survey(survey_id: UUID4) -> Optional[PublicSurveyInfo]:
+    found, public_survey = public_survey_cache.get(survey_id)
+    if found:
+        return public_survey
+
+    # Cache a detached snapshot, or None so unknown ids don't hit the database
+    survey = Survey.query.filter_by(id=survey_id).first()
+    public_survey = (
+        PublicSurveyInfo(
+            id=survey.id,
+            name=survey.name,
+            question=survey.question,
+            end_date=survey.end_date,
+            is_anonymous=survey.is_anonymous,
+            status=survey.status,
+            created_at=survey.created_at,
+            updated_at=survey.updated_at,
+            version=survey.version,
+        )
+        if survey
+        else None
+    )
+    public_survey_cache.set(survey_id, public_survey)
+
+    return public_survey
+
+
 def get_survey_by_id_public(
     survey_id: UUID4,
-) -> Tuple[Optional[Survey], Optional[Tuple[Dict, int]]]:
-    survey = Survey.query.filter_by(id=survey_id).first()
+) -> Tuple[Optional[PublicSurveyInfo], Optional[Tuple[Dict, int]]]:
+    survey = get_public_survey(survey_id)
     if survey is None:
         return None, ({"error": "Survey not found"}, 404)
     return survey, None
@@ -132,25 +688,60 @@ def handle_validation_error(error: ValidationError) -> Tuple[Dict, int]:
 def terminate_survey(survey: Survey) -> None:
     if survey.status != SurveyStatus.CLOSED:
         survey.status = SurveyStatus.CLOSED
+        survey.ended_email_pending = True
+        bump_survey_version(survey.id)
         db.session.commit()
+        public_survey_cache.invalidate(survey.id)
         run_concurrent_email_task(send_survey_ended_email, survey.id)
 
 
+def dispatch_new_survey_emails(survey_id: UUID4) -> None:
+    # New recipients only add PENDING tasks, which dedicated email workers pick
+    # up on their own
+    if current_app.config.get("EMAIL_TASK_DISPATCH", "pool") == "worker":
+        return
+    run_concurrent_email_task(dispatch_survey_emails, survey_id)
+
+
 def retry_failed_survey_emails(survey_id: UUID4) -> None:
+    # With dedicated email workers the API only re-queues failed tasks
+    if current_app.config.get("EMAIL_TASK_DISPATCH", "pool") == "worker":
+        reset_failed_email_tasks(survey_id)
+        return
     run_concurrent_email_task(send_survey_emails, survey_id)
 
 
 __all__ = [
     "EmailTaskInfo",
     "EmailStatusSummary",
+    "get_email_status_summaries",
     "get_email_status_summary",
     "get_email_tasks_info",
-    "get_survey_results",
-    "get_detailed_responses",
-    "check_and_update_survey_status",
+    "get_recipient_emails",
+    "get_respondent_emails",
+    "get_surveys_recipient_counts",
+    "normalize_recipient_email",
+    "normalize_recipient_emails",
+    "add_survey_recipients",
+    "load_survey_recipients",
+    "SURVEY_RESULT_COUNTER_COLUMNS",
+    "SurveyResponseOutcome",
+    "SurveyResponseSubmission",
+    "record_survey_responses",
+    "record_survey_response",
+    "rebuild_survey_result_counters",
+    "get_surveys_result_counts",
+    "iter_detailed_responses",
+    "get_detailed_responses_page",
+    "get_daily_response_counts",
+    "search_surveys",
+    "get_survey_status",
     "get_survey_by_id",
+    "PublicSurveyInfo",
+    "get_public_survey",
     "get_survey_by_id_public",
     "handle_validation_error",
     "terminate_survey",
+    "dispatch_new_survey_emails",
     "retry_failed_survey_emails",
 ]
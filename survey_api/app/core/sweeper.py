@@ -0,0 +1,101 @@
+import threading
+import time
+from concurrent.futures import Future
+from typing import Optional
+
+from flask import Flask
+
+from . import workers
+from .db import db
+from .email import dispatch_due_email_tasks
+from .utils import close_expired_surveys
+from .workers import WorkerQueueFullError, run_in_worker_pool
+
+_sweeper_lock = threading.Lock()
+_sweeper_thread = None
+_email_retry_thread = None
+
+
+def _run_expiry_sweeper(app: Flask, interval: float) -> None:
+    while True:
+        time.sleep(interval)
+        with app.app_context():
+            try:
+                survey_ids = close_expired_surveys()
+                if survey_ids:
+                    app.logger.info(f"Closed {len(survey_ids)} expired surveys")
+            except Exception as e:
+                db.session.rollback()
+                app.logger.error(f"Failed to close expired surveys: {e}")
+            finally:
+                db.session.remove()
+
+
+def _run_email_retry_sweeper(app: Flask, interval: float) -> None:
+    # Only schedules: the sending runs on the bounded email worker pool, and a
+    # sweep is skipped while the previous one is still running
+    sweep: Optional[Future] = None
+    while True:
+        time.sleep(interval)
+        if sweep is not None and not sweep.done():
+            continue
+        try:
+            sweep = run_in_worker_pool(dispatch_due_email_tasks)
+        except WorkerQueueFullError as e:
+            app.logger.warning(f"Skipped sending due email tasks: {e}")
+
+
+def setup_email_retry_sweeper(app: Flask) -> None:
+    # Dedicated email workers already poll for due tasks, and without a worker
+    # pool ("sync" mode) retries are left to the email-worker command rather
+    # than sent from the web process
+    if app.config.get("EMAIL_TASK_DISPATCH", "pool") == "worker":
+        return
+    if workers.email_worker_pool is None:
+        return
+    interval = float(app.config.get("EMAIL_RETRY_SWEEP_INTERVAL", 30))
+    if interval <= 0:
+        return
+
+    # Start lazily on the first request, like the expiry sweeper
+    @app.before_request
+    def start_email_retry_sweeper():
+        global _email_retry_thread
+
+        if _email_retry_thread is not None:
+            return
+        with _sweeper_lock:
+            if _email_retry_thread is None:
+                _email_retry_thread = threading.Thread(
+                    target=_run_email_retry_sweeper,
+                    args=(app, interval),
+                    name="email-retry-sweeper",
+                    daemon=True,
+                )
+                _email_retry_thread.start()
+
+
+def setup_expiry_sweeper(app: Flask) -> None:
+    interval = float(app.config.get("EXPIRY_SWEEP_INTERVAL", 60))
+    if interval <= 0:
+        return
+
+    # Start lazily on the first request so CLI commands (e.g. migrations) don't sweep
+    @app.before_request
+    def start_expiry_sweeper():
+        global _sweeper_thread
+
+        if _sweeper_thread is not None:
+            return
+        with _sweeper_lock:
+            if _sweeper_thread is None:
+                _sweeper_thread = threading.Thread(
+                    target=_run_expiry_sweeper,
+                    args=(app, interval),
+                    name="expiry-sweeper",
+                    daemon=True,
+                )
+                _sweeper_thread.start()
+
+
+__all__ = ["setup_expiry_sweeper", "setup_email_retry_sweeper"]
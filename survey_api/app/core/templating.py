@@ -0,0 +1,73 @@
+import html
+from string import Formatter
+from typing import Any, List, Tuple, Union
+
+
+class CompiledTemplate:
+    """A str.format-style template parsed once into literal text and fields.
+
+    Values are HTML-escaped when they are filled in. partial() fills in some
+    fields and returns a smaller template, so the parts shared by many renders
+    (e.g. one survey's text) are done once and render() only joins the rest.
+    A CompiledTemplate may be given as a value; it is spliced in with its text
+    escaped and its fields kept.
+    """
+
+    def __init__(self, source: str = "", parts: Tuple[Any, ...] = None):
+        if parts is None:
+            parsed: List[Any] = []
+            for literal, field_name, _, _ in Formatter().parse(source):
+                if literal:
+                    parsed.append(literal)
+                if field_name is not None:
+                    parsed.append(_Field(field_name))
+            parts = tuple(parsed)
+        self._parts = _merge_literals(parts)
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        return tuple(dict.fromkeys(p.name for p in self._parts if isinstance(p, _Field)))
+
+    def escaped(self) -> "CompiledTemplate":
+        return CompiledTemplate(
+            parts=tuple(p if isinstance(p, _Field) else html.escape(p) for p in self._parts)
+        )
+
+    def partial(self, **values: Union[str, int, "CompiledTemplate"]) -> "CompiledTemplate":
+        parts: List[Any] = []
+        for part in self._parts:
+            if not isinstance(part, _Field) or part.name not in values:
+                parts.append(part)
+                continue
+            value = values[part.name]
+            if isinstance(value, CompiledTemplate):
+                parts.extend(value.escaped()._parts)
+            else:
+                parts.append(html.escape(str(value)))
+        return CompiledTemplate(parts=tuple(parts))
+
+    def render(self, **values: Union[str, int]) -> str:
+        escaped = {name: html.escape(str(value)) for name, value in values.items()}
+        return "".join(
+            escaped[part.name] if isinstance(part, _Field) else part for part in self._parts
+        )
+
+
+class _Field:
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+def _merge_literals(parts: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    merged: List[Any] = []
+    for part in parts:
+        if merged and not isinstance(part, _Field) and not isinstance(merged[-1], _Field):
+            merged[-1] += part
+        else:
+            merged.append(part)
+    return tuple(merged)
+
+
+__all__ = ["CompiledTemplate"]
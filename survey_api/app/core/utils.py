@@ -1,34 +1,85 @@
 from datetime import datetime, timezone
-import multiprocessing
-import threading
+from typing import Any, List
+from uuid import UUID
+
+from flask import current_app
+from sqlalchemy import func, select, update
+
 from .models import Survey, SurveyStatus
+from .cache import public_survey_cache
 from .db import db
 from .email import send_survey_ended_email
+from .workers import WorkerQueueFullError, run_in_worker_pool
 
-CONCURRENCY_MODE = "process"  # "process", "thread", or None
+# Advisory lock key held while sweeping expired surveys
+EXPIRY_SWEEP_LOCK_KEY = 7_315_001
 
 
-def run_concurrent_email_task(email_func, *args):
-    if CONCURRENCY_MODE == "process":
-        p = multiprocessing.Process(target=email_func, args=args)
-        p.start()
-    elif CONCURRENCY_MODE == "thread":
-        t = threading.Thread(target=email_func, args=args)
-        t.start()
-    else:
-        email_func(*args)
+def run_concurrent_email_task(email_func, *args) -> bool:
+    try:
+        run_in_worker_pool(email_func, *args)
+    except WorkerQueueFullError as e:
+        # The tasks stay PENDING and can be retried once the pool drains
+        current_app.logger.warning(f"Skipped {email_func.__name__}{args}: {e}")
+        return False
+    return True
 
 
-def close_expired_survey(survey: Survey) -> bool:
+def get_effective_survey_status(survey: Any) -> SurveyStatus:
+    # Expired surveys count as closed even before the sweeper has closed them
     if survey.status == SurveyStatus.ACTIVE and survey.end_date <= datetime.now(
         timezone.utc
     ):
-        survey.status = SurveyStatus.CLOSED
+        return SurveyStatus.CLOSED
+
+    return survey.status
+
+
+def close_expired_surveys() -> List[UUID]:
+    # Only one replica at a time may sweep, the others skip this round
+    is_locked = db.session.scalar(
+        select(func.pg_try_advisory_xact_lock(EXPIRY_SWEEP_LOCK_KEY))
+    )
+    if not is_locked:
+        db.session.rollback()
+        return []
+
+    survey_ids = list(
+        db.session.scalars(
+            update(Survey)
+            .where(Survey.status == SurveyStatus.ACTIVE, Survey.end_date <= func.now())
+            .values(
+                status=SurveyStatus.CLOSED,
+                version=Survey.version + 1,
+                ended_email_pending=True,
+            )
+            .returning(Survey.id)
+            .execution_options(synchronize_session=False)
+        )
+    )
+    db.session.commit()
+
+    for survey_id in survey_ids:
+        public_survey_cache.invalidate(survey_id)
+
+    dispatch_pending_ended_emails()
 
-        db.session.commit()
+    return survey_ids
 
-        run_concurrent_email_task(send_survey_ended_email, survey.id)
 
-        return True
+def dispatch_pending_ended_emails() -> int:
+    # Also picks up the surveys closed in earlier rounds whose job was rejected
+    # by a full pool. Jobs submitted twice are harmless, only the one that
+    # claims the flag sends
+    survey_ids = db.session.scalars(
+        select(Survey.id).where(Survey.ended_email_pending.is_(True))
+    ).all()
+    db.session.rollback()
 
-    return False
+    submitted = 0
+    for survey_id in survey_ids:
+        if not run_concurrent_email_task(send_survey_ended_email, survey_id):
+            # The pool is full, the rest stay pending for the next round
+            break
+        submitted += 1
+    return submitted
@@ -0,0 +1,60 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from flask import Response, request
+from pydantic import UUID4
+from sqlalchemy import select, update
+
+from .db import db
+from .models import Survey, SurveyStatus
+
+
+def bump_survey_version(survey_id: UUID4) -> None:
+    # Runs in the caller's transaction, updated_at is left untouched on purpose
+    db.session.execute(
+        update(Survey)
+        .where(Survey.id == survey_id)
+        .values(version=Survey.version + 1, updated_at=Survey.updated_at)
+    )
+
+
+def get_survey_version(
+    survey_id: UUID4, owner_id: Optional[UUID4] = None
+) -> Optional[int]:
+    query = select(Survey.version, Survey.status, Survey.end_date).where(
+        Survey.id == survey_id
+    )
+    if owner_id:
+        query = query.where(Survey.owner_id == owner_id)
+
+    row = db.session.execute(query).first()
+    if not row:
+        return None
+
+    # An expired survey reads as closed before the sweeper bumps its version
+    version, status, end_date = row
+    if status == SurveyStatus.ACTIVE and end_date <= datetime.now(timezone.utc):
+        return None
+
+    return version
+
+
+def make_survey_etag(resource: str, survey_id: UUID4, version: int) -> str:
+    return f"{resource}-{survey_id}-{version}"
+
+
+def not_modified_response(etag: str) -> Optional[Response]:
+    if not request.if_none_match.contains(etag):
+        return None
+
+    response = Response(status=304)
+    response.set_etag(etag)
+    return response
+
+
+__all__ = [
+    "bump_survey_version",
+    "get_survey_version",
+    "make_survey_etag",
+    "not_modified_response",
+]
@@ -0,0 +1,166 @@
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from flask import Flask
+
+from .db import db
+
+# The app used by pool workers; forked worker processes inherit it
+_worker_app: Optional[Flask] = None
+
+
+class WorkerQueueFullError(Exception):
+    pass
+
+
+def _init_worker_process() -> None:
+    # Drop the connections inherited from the parent without closing them, so the
+    # parent's sockets stay usable and the child opens its own
+    with _worker_app.app_context():
+        db.engine.dispose(close=False)
+
+
+def _run_job(func: Callable, *args: Any) -> Any:
+    with _worker_app.app_context():
+        return func(*args)
+
+
+class BoundedExecutor:
+    """Long-lived process or thread pool with a bounded backlog"""
+
+    def __init__(
+        self,
+        mode: str = "process",
+        max_workers: int = 4,
+        max_queue_size: int = 100,
+        submit_timeout: float = 5.0,
+    ):
+        self.mode = mode
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.submit_timeout = submit_timeout
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        # Running plus queued jobs may not exceed this many
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue_size)
+        self._executor: Optional[Executor] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _create_executor(self) -> Executor:
+        if self.mode == "process":
+            return ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker_process,
+            )
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="email-worker"
+        )
+
+    def _get_executor(self) -> Executor:
+        # Created on first use, and again in a forked server worker, so each
+        # serving process owns its pool
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = self._create_executor()
+                self._pid = os.getpid()
+            return self._executor
+
+    def _on_done(self, future: Future) -> None:
+        self._slots.release()
+        with self._lock:
+            if future.cancelled() or future.exception() is not None:
+                self.failed += 1
+            else:
+                self.completed += 1
+
+    def submit(self, func: Callable, *args: Any) -> Future:
+        # Backpressure: wait for a free slot, then give up
+        if not self._slots.acquire(timeout=self.submit_timeout):
+            with self._lock:
+                self.rejected += 1
+            raise WorkerQueueFullError(
+                f"Email worker queue is full ({self.max_queue_size} jobs waiting)"
+            )
+
+        try:
+            future = self._get_executor().submit(_run_job, func, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self.submitted += 1
+        future.add_done_callback(self._on_done)
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        # Let running jobs finish; queued ones stay PENDING in the database
+        with self._lock:
+            executor, self._executor = self._executor, None
+            is_owner = self._pid == os.getpid()
+        if executor is not None and is_owner:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            pending = self.submitted - self.completed - self.failed
+            return {
+                "mode": self.mode,
+                "maxWorkers": self.max_workers,
+                "maxQueueSize": self.max_queue_size,
+                "inFlight": min(pending, self.max_workers),
+                "queueDepth": max(pending - self.max_workers, 0),
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+            }
+
+
+email_worker_pool: Optional[BoundedExecutor] = None
+
+
+def run_in_worker_pool(func: Callable, *args: Any) -> Optional[Future]:
+    # Without a pool (e.g. "sync" mode) the job runs inline
+    if email_worker_pool is None:
+        func(*args)
+        return None
+    return email_worker_pool.submit(func, *args)
+
+
+def get_email_worker_pool_stats() -> Optional[Dict[str, Any]]:
+    return email_worker_pool.stats() if email_worker_pool is not None else None
+
+
+def setup_email_workers(app: Flask) -> None:
+    global _worker_app, email_worker_pool
+
+    _worker_app = app
+    mode = app.config.get("EMAIL_WORKER_MODE", "process").lower()
+    if mode not in ("process", "thread"):
+        return
+
+    email_worker_pool = BoundedExecutor(
+        mode=mode,
+        max_workers=int(app.config.get("EMAIL_WORKER_MAX_WORKERS", 4)),
+        max_queue_size=int(app.config.get("EMAIL_WORKER_QUEUE_SIZE", 100)),
+        submit_timeout=float(app.config.get("EMAIL_WORKER_SUBMIT_TIMEOUT", 5)),
+    )
+    atexit.register(email_worker_pool.shutdown)
+
+
+__all__ = [
+    "WorkerQueueFullError",
+    "BoundedExecutor",
+    "email_worker_pool",
+    "run_in_worker_pool",
+    "get_email_worker_pool_stats",
+    "setup_email_workers",
+]
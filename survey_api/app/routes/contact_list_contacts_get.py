@@ -0,0 +1,51 @@
+from flask import Blueprint, jsonify, request
+from pydantic import UUID4
+
+from ..auth.jwt import validate_token, get_user_id_from_token
+from ..core.contact_list_service import get_contact_emails, get_contact_list_by_id
+from ..core.pagination import MAX_PAGE_SIZE, parse_page_args
+
+contact_list_contacts_get_blueprint = Blueprint(
+    "contact_list_contacts_get_routes", __name__
+)
+
+
+@contact_list_contacts_get_blueprint.route(
+    "/contact-lists/<uuid:contact_list_id>/contacts", methods=["GET"]
+)
+@validate_token
+def contact_list_contacts_get(contact_list_id: UUID4):
+    user_id = get_user_id_from_token()
+    if not user_id:
+        return jsonify({"error": "Invalid token"}), 401
+
+    page_args = parse_page_args(request.args)
+    if page_args is None:
+        return (
+            jsonify(
+                {"error": f"page must be >= 1 and pageSize between 1 and {MAX_PAGE_SIZE}"}
+            ),
+            400,
+        )
+    page, page_size = page_args
+
+    contact_list, error_response = get_contact_list_by_id(contact_list_id, user_id)
+    if error_response:
+        return jsonify(error_response[0]), error_response[1]
+
+    contact_emails, total = get_contact_emails(contact_list.id, page, page_size)
+
+    return (
+        jsonify(
+            {
+                "items": contact_emails,
+                "total": total,
+                "page": page,
+                "pageSize": page_size,
+            }
+        ),
+        200,
+    )
+
+
+__all__ = ["contact_list_contacts_get_blueprint"]
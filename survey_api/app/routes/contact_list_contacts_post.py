@@ -0,0 +1,48 @@
+from typing import List
+
+from flask import Blueprint, jsonify, request
+from pydantic import EmailStr, Field, UUID4, ValidationError
+
+from ..auth.jwt import validate_token, get_user_id_from_token
+from ..core.contact_list_service import add_contacts, get_contact_list_by_id
+from ..core.db import db
+from ..core.pydantic import PydanticBaseModel
+from ..core.survey_service import handle_validation_error, normalize_recipient_emails
+from .contact_list_post import MAX_CONTACTS_PER_REQUEST
+
+contact_list_contacts_post_blueprint = Blueprint(
+    "contact_list_contacts_post_routes", __name__
+)
+
+
+class PostContactsRequest(PydanticBaseModel):
+    contacts: List[EmailStr] = Field(min_length=1, max_length=MAX_CONTACTS_PER_REQUEST)
+
+
+@contact_list_contacts_post_blueprint.route(
+    "/contact-lists/<uuid:contact_list_id>/contacts", methods=["POST"]
+)
+@validate_token
+def contact_list_contacts_post(contact_list_id: UUID4):
+    try:
+        data = PostContactsRequest.model_validate(request.json)
+    except ValidationError as e:
+        error_response = handle_validation_error(e)
+        return jsonify(error_response[0]), error_response[1]
+
+    user_id = get_user_id_from_token()
+    if not user_id:
+        return jsonify({"error": "Invalid token"}), 401
+
+    contact_list, error_response = get_contact_list_by_id(contact_list_id, user_id)
+    if error_response:
+        return jsonify(error_response[0]), error_response[1]
+
+    emails = normalize_recipient_emails(data.contacts)
+    added = add_contacts(contact_list.id, emails)
+    db.session.commit()
+
+    return jsonify({"added": added, "duplicates": len(emails) - added}), 200
+
+
+__all__ = ["contact_list_contacts_post_blueprint"]
@@ -0,0 +1,30 @@
+from flask import Blueprint, jsonify
+from pydantic import UUID4
+
+from ..auth.jwt import validate_token, get_user_id_from_token
+from ..core.contact_list_service import get_contact_list_by_id
+from ..core.db import db
+
+contact_list_delete_blueprint = Blueprint("contact_list_delete_routes", __name__)
+
+
+@contact_list_delete_blueprint.route(
+    "/contact-lists/<uuid:contact_list_id>", methods=["DELETE"]
+)
+@validate_token
+def contact_list_delete(contact_list_id: UUID4):
+    user_id = get_user_id_from_token()
+    if not user_id:
+        return jsonify({"error": "Invalid token"}), 401
+
+    contact_list, error_response = get_contact_list_by_id(contact_list_id, user_id)
+    if error_response:
+        return jsonify(error_response[0]), error_response[1]
+
+    # Surveys keep their recipients; contacts go with the list (ON DELETE CASCADE)
+    db.session.delete(contact_list)
+    db.session.commit()
+    return jsonify({"message": "Contact list deleted"}), 200
+
+
+__all__ = ["contact_list_delete_blueprint"]
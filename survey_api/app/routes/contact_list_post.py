@@ -0,0 +1,64 @@
+from datetime import datetime
+from typing import List
+
+from flask import Blueprint, jsonify, request
+from pydantic import EmailStr, Field, UUID4, ValidationError
+
+from ..auth.jwt import validate_token, get_user_id_from_token
+from ..core.contact_list_service import add_contacts
+from ..core.db import db
+from ..core.models import ContactList
+from ..core.pydantic import PydanticBaseModel
+from ..core.survey_service import handle_validation_error, normalize_recipient_emails
+
+contact_list_post_blueprint = Blueprint("contact_list_post_routes", __name__)
+
+MAX_CONTACTS_PER_REQUEST = 50000
+
+
+class PostContactListRequest(PydanticBaseModel):
+    name: str = Field(min_length=1, max_length=255)
+    contacts: List[EmailStr] = Field(default=[], max_length=MAX_CONTACTS_PER_REQUEST)
+
+
+class PostContactListResponse(PydanticBaseModel):
+    id: UUID4
+    name: str
+    contactCount: int
+    createdAt: datetime
+    updatedAt: datetime
+
+
+@contact_list_post_blueprint.route("/contact-lists", methods=["POST"])
+@validate_token
+def contact_list_post():
+    try:
+        data = PostContactListRequest.model_validate(request.json)
+    except ValidationError as e:
+        error_response = handle_validation_error(e)
+        return jsonify(error_response[0]), error_response[1]
+
+    user_id = get_user_id_from_token()
+    if not user_id:
+        return jsonify({"error": "Invalid token"}), 401
+
+    contact_list = ContactList(name=data.name, owner_id=user_id)
+    db.session.add(contact_list)
+    db.session.flush()
+    contact_count = add_contacts(
+        contact_list.id, normalize_recipient_emails(data.contacts)
+    )
+    db.session.commit()
+
+    response = PostContactListResponse(
+        id=contact_list.id,
+        name=contact_list.name,
+        contactCount=contact_count,
+        createdAt=contact_list.created_at,
+        updatedAt=contact_list.updated_at,
+    ).model_dump()
+
+    return jsonify(response), 201
+
+
+__all__ = ["contact_list_post_blueprint"]
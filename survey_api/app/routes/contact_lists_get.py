@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from flask import Blueprint, jsonify
+from pydantic import UUID4
+
+from ..auth.jwt import validate_token, get_user_id_from_token
+from ..core.contact_list_service import get_contact_list_counts, get_contact_lists
+from ..core.pydantic import PydanticBaseModel
+
+contact_lists_get_blueprint = Blueprint("contact_lists_get_routes", __name__)
+
+
+class ContactListsGetResponse(PydanticBaseModel):
+    id: UUID4
+    name: str
+    contactCount: int
+    createdAt: datetime
+    updatedAt: datetime
+
+
+@contact_lists_get_blueprint.route("/contact-lists", methods=["GET"])
+@validate_token
+def contact_lists_get():
+    user_id = get_user_id_from_token()
+    if not user_id:
+        return jsonify({"error": "Invalid token"}), 401
+
+    contact_lists = get_contact_lists(user_id)
+    contact_counts = get_contact_list_counts(
+        contact_list.id for contact_list in contact_lists
+    )
+
+    response = [
+        ContactListsGetResponse(
+            id=contact_list.id,
+            name=contact_list.name,
+            contactCount=contact_counts[contact_list.id],
+            createdAt=contact_list.created_at,
+            updatedAt=contact_list.updated_at,
+        ).model_dump()
+        for contact_list in contact_lists
+    ]
+
+    return jsonify(response), 200
+
+
+__all__ = ["contact_lists_get_blueprint"]
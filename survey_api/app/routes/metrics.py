@@ -0,0 +1,28 @@
+from flask import Blueprint, jsonify
+
+from ..auth.jwt import validate_token
+from ..core.batching import get_response_batcher_stats
+from ..core.cache import public_survey_cache
+from ..core.email_sender import get_email_sender_stats
+from ..core.workers import get_email_worker_pool_stats
+
+metrics_blueprint = Blueprint("metrics_routes", __name__)
+
+
+@metrics_blueprint.route("/metrics", methods=["GET"])
+@validate_token
+def metrics():
+    return (
+        jsonify(
+            {
+                "publicSurveyCache": public_survey_cache.stats(),
+                "responseBatcher": get_response_batcher_stats(),
+                "emailWorkerPool": get_email_worker_pool_stats(),
+                "emailSenders": get_email_sender_stats(),
+            }
+        ),
+        200,
+    )
+
+
+__all__ = ["metrics_blueprint"]
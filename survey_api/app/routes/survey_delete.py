@@ -2,6 +2,7 @@ from flask import Blueprint, jsonify
 from pydantic import UUID4
 
 from ..auth.jwt import validate_token, get_user_id_from_token
+from ..core.cache import public_survey_cache
 from ..core.db import db
 from ..core.survey_service import get_survey_by_id
 
@@ -21,6 +22,7 @@ def survey_delete(survey_id: UUID4):
 
     db.session.delete(survey)
     db.session.commit()
+    public_survey_cache.invalidate(survey_id)
     return jsonify({"message": "Survey deleted"}), 200
 
 
@@ -0,0 +1,61 @@
+from flask import Blueprint, jsonify, request
+from pydantic import UUID4
+
+from ..auth.jwt import validate_token, get_user_id_from_token
+from ..core.models import EmailTaskStatus
+from ..core.pagination import MAX_PAGE_SIZE, parse_page_args
+from ..core.survey_service import get_survey_by_id, get_email_tasks_info
+
+survey_email_tasks_get_blueprint = Blueprint(
+    "survey_email_tasks_get_routes", __name__
+)
+
+
+@survey_email_tasks_get_blueprint.route(
+    "/surveys/<uuid:survey_id>/email-tasks", methods=["GET"]
+)
+@validate_token
+def survey_email_tasks_get(survey_id: UUID4):
+    user_id = get_user_id_from_token()
+    if not user_id:
+        return jsonify({"error": "Invalid token"}), 401
+
+    page_args = parse_page_args(request.args)
+    if page_args is None:
+        return (
+            jsonify(
+                {"error": f"page must be >= 1 and pageSize between 1 and {MAX_PAGE_SIZE}"}
+            ),
+            400,
+        )
+    page, page_size = page_args
+
+    status = request.args.get("status")
+    if status and status not in EmailTaskStatus.__members__:
+        return jsonify({"error": "Status must be one of: PENDING, SENT, FAILED"}), 400
+
+    survey, error_response = get_survey_by_id(survey_id, user_id)
+    if error_response:
+        return jsonify(error_response[0]), error_response[1]
+
+    email_tasks, total = get_email_tasks_info(
+        survey.id,
+        EmailTaskStatus[status] if status else None,
+        page,
+        page_size,
+    )
+
+    return (
+        jsonify(
+            {
+                "items": [email_task.model_dump() for email_task in email_tasks],
+                "total": total,
+                "page": page,
+                "pageSize": page_size,
+            }
+        ),
+        200,
+    )
+
+
+__all__ = ["survey_email_tasks_get_blueprint"]
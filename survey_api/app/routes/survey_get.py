@@ -1,17 +1,23 @@
 from datetime import datetime
-from typing import List, Optional
 
-from flask import Blueprint, jsonify
-from pydantic import UUID4, EmailStr
+from flask import Blueprint, jsonify, request
+from pydantic import UUID4
 
 from ..auth.jwt import validate_token, get_user_id_from_token
 from ..core.models import Survey
 from ..core.pydantic import PydanticBaseModel
 from ..core.survey_service import (
-    EmailTaskInfo,
-    get_survey_results,
-    get_email_tasks_info,
-    check_and_update_survey_status,
+    EmailStatusSummary,
+    get_surveys_result_counts,
+    get_email_status_summary,
+    get_surveys_recipient_counts,
+    get_survey_status,
+    get_public_survey,
+)
+from ..core.versioning import (
+    get_survey_version,
+    make_survey_etag,
+    not_modified_response,
 )
 
 survey_get_blueprint = Blueprint("survey_get_routes", __name__)
@@ -23,13 +29,13 @@ class SurveyGetResponse(PydanticBaseModel):
     question: str
     endDate: datetime
     isAnonymous: bool
-    recipients: List[EmailStr]
+    recipientCount: int
     status: str
     createdAt: datetime
     updatedAt: datetime
     results: dict
-    respondentEmails: Optional[List[EmailStr]]
-    emailStatus: List[EmailTaskInfo]
+    totalResponses: int
+    emailStatusSummary: EmailStatusSummary
 
 
 class SurveyPublicGetResponse(PydanticBaseModel):
@@ -47,14 +53,26 @@ class SurveyPublicGetResponse(PydanticBaseModel):
 @validate_token
 def survey_get(survey_id: UUID4):
     user_id = get_user_id_from_token()
+
+    # Answer conditional requests from the version alone
+    if request.if_none_match:
+        version = get_survey_version(survey_id, user_id)
+        if version is not None:
+            response = not_modified_response(
+                make_survey_etag("survey", survey_id, version)
+            )
+            if response:
+                return response
+
     survey = Survey.query.filter_by(id=survey_id, owner_id=user_id).first()
     if not survey:
         return jsonify({"error": "Survey not found"}), 404
 
-    email_status = get_email_tasks_info(survey_id)
-    recipient_emails = [r.email for r in survey.recipients_list]
+    # Only summaries here, the lists are served by the paginated sub-resources
+    email_status_summary = get_email_status_summary(survey.id)
+    recipient_count = get_surveys_recipient_counts([survey.id])[survey.id]
 
-    results, respondent_emails = get_survey_results(survey)
+    results = get_surveys_result_counts([survey.id])[survey.id]
 
     response_data = SurveyGetResponse(
         id=survey.id,
@@ -62,25 +80,33 @@ def survey_get(survey_id: UUID4):
         question=survey.question,
         endDate=survey.end_date,
         isAnonymous=survey.is_anonymous,
-        recipients=recipient_emails,
-        status=survey.status.value,
+        recipientCount=recipient_count,
+        status=get_survey_status(survey).value,
         createdAt=survey.created_at,
         updatedAt=survey.updated_at,
         results=results,
-        respondentEmails=respondent_emails if not survey.is_anonymous else None,
-        emailStatus=email_status,
+        totalResponses=sum(results.values()),
+        emailStatusSummary=email_status_summary,
     )
 
-    return jsonify(response_data.model_dump()), 200
+    response = jsonify(response_data.model_dump())
+    response.set_etag(make_survey_etag("survey", survey.id, survey.version))
+    return response, 200
 
 
 @survey_get_blueprint.route("/surveys/<uuid:survey_id>/public", methods=["GET"])
 def survey_public_get(survey_id):
-    survey: Optional[Survey] = Survey.query.filter_by(id=survey_id).first()
+    survey = get_public_survey(survey_id)
     if not survey:
         return jsonify({"error": "Survey not found"}), 404
 
-    check_and_update_survey_status(survey)
+    # An expired survey reads as closed before the sweeper bumps its version,
+    # so its ETag can't be trusted until then
+    etag = make_survey_etag("public", survey.id, survey.version)
+    if not survey.is_expired:
+        response = not_modified_response(etag)
+        if response:
+            return response
 
     response_data = SurveyPublicGetResponse(
         id=survey.id,
@@ -88,12 +114,14 @@ def survey_public_get(survey_id):
         question=survey.question,
         endDate=survey.end_date,
         isAnonymous=survey.is_anonymous,
-        status=survey.status,
+        status=survey.effective_status.value,
         createdAt=survey.created_at,
         updatedAt=survey.updated_at,
     )
 
-    return jsonify(response_data.model_dump()), 200
+    response = jsonify(response_data.model_dump())
+    response.set_etag(etag)
+    return response, 200
 
 
 __all__ = ["survey_get_blueprint"]
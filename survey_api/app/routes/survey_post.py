@@ -1,23 +1,33 @@
 from datetime import datetime
 from flask import Blueprint, request, jsonify
 from pydantic import ValidationError, UUID4, EmailStr, Field
-from typing import List
+from typing import List, Optional
 
 from ..auth.jwt import validate_token, get_user_id_from_token
+from ..core.cache import public_survey_cache
+from ..core.contact_list_service import add_contact_list_recipients, get_contact_list_by_id
 from ..core.db import db
-from ..core.models import Survey, SurveyStatus, Recipient, EmailTask
+from ..core.models import Survey, SurveyStatus
 from ..core.pydantic import PydanticBaseModel
-from ..core.survey_service import handle_validation_error, retry_failed_survey_emails
+from ..core.survey_service import (
+    add_survey_recipients,
+    dispatch_new_survey_emails,
+    handle_validation_error,
+    normalize_recipient_emails,
+)
 
 survey_post_blueprint = Blueprint("survey_post_routes", __name__)
 
+MAX_SURVEY_RECIPIENTS = 50000
+
 
 class PostSurveyRequest(PydanticBaseModel):
     name: str = Field(min_length=1, max_length=255)
     question: str = Field(min_length=1)
     endDate: datetime
     isAnonymous: bool = False
-    recipients: List[EmailStr] = Field(min_length=1, max_items=50)
+    recipients: List[EmailStr] = Field(default=[], max_length=MAX_SURVEY_RECIPIENTS)
+    contactListId: Optional[UUID4] = None
 
 
 class PostSurveyResponse(PydanticBaseModel):
@@ -27,6 +37,7 @@ class PostSurveyResponse(PydanticBaseModel):
     endDate: datetime
     isAnonymous: bool
     recipients: List[EmailStr]
+    contactListId: Optional[UUID4]
     status: str
     createdAt: datetime
     updatedAt: datetime
@@ -45,6 +56,14 @@ def survey_post():
     if not user_id:
         return jsonify({"error": "Invalid token"}), 401
 
+    if not data.recipients and data.contactListId is None:
+        return jsonify({"error": "Either recipients or contactListId is required"}), 400
+
+    if data.contactListId is not None:
+        _, error_response = get_contact_list_by_id(data.contactListId, user_id)
+        if error_response:
+            return jsonify(error_response[0]), error_response[1]
+
     survey = Survey(
         name=data.name,
         question=data.question,
@@ -52,23 +71,24 @@ def survey_post():
         is_anonymous=data.isAnonymous,
         owner_id=user_id,
         status=SurveyStatus.ACTIVE.value,
+        contact_list_id=data.contactListId,
     )
 
-    db.session.add(survey)
-    db.session.commit()
-
-    for email in data.recipients:
-        recipient = Recipient(survey_id=survey.id, email=email)
-        db.session.add(recipient)
-
-        email_task = EmailTask(survey_id=survey.id, recipient_email=email)
-        db.session.add(email_task)
+    recipient_emails = normalize_recipient_emails(data.recipients)
 
+    # Create the survey, its recipients and its email tasks in one transaction
+    db.session.add(survey)
+    db.session.flush()
+    add_survey_recipients(survey.id, recipient_emails)
+    if data.contactListId is not None:
+        recipient_emails += add_contact_list_recipients(survey.id, data.contactListId)
+    if not recipient_emails:
+        db.session.rollback()
+        return jsonify({"error": "Contact list has no contacts"}), 400
     db.session.commit()
+    public_survey_cache.invalidate(survey.id)
 
-    recipient_emails = [r.email for r in survey.recipients_list]
-
-    retry_failed_survey_emails(survey.id)
+    dispatch_new_survey_emails(survey.id)
 
     response = PostSurveyResponse(
         id=survey.id,
@@ -77,6 +97,7 @@ def survey_post():
         endDate=survey.end_date,
         isAnonymous=survey.is_anonymous,
         recipients=recipient_emails,
+        contactListId=survey.contact_list_id,
         status=survey.status.value,
         createdAt=survey.created_at,
         updatedAt=survey.updated_at,
@@ -0,0 +1,128 @@
+import csv
+import io
+from itertools import islice
+from typing import BinaryIO, Dict, Iterator, List
+
+from flask import Blueprint, jsonify, request
+from pydantic import UUID4, EmailStr, TypeAdapter, ValidationError
+
+from ..auth.jwt import validate_token, get_user_id_from_token
+from ..core.db import db
+from ..core.models import SurveyStatus
+from ..core.survey_service import (
+    dispatch_new_survey_emails,
+    get_survey_by_id,
+    get_survey_status,
+    load_survey_recipients,
+)
+from ..core.versioning import bump_survey_version
+
+survey_recipients_upload_post_blueprint = Blueprint(
+    "survey_recipients_upload_post_routes", __name__
+)
+
+# Rows validated at a time
+RECIPIENT_UPLOAD_CHUNK_SIZE = 1000
+# Invalid rows listed in the response; the rest are only counted
+MAX_REPORTED_INVALID_ROWS = 100
+
+email_adapter = TypeAdapter(EmailStr)
+
+
+class RecipientUpload:
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self.invalid_count = 0
+        self.invalid_rows: List[Dict] = []
+
+    def _add_invalid_row(self, line: int, value: str, error: str) -> None:
+        self.invalid_count += 1
+        if len(self.invalid_rows) < MAX_REPORTED_INVALID_ROWS:
+            self.invalid_rows.append({"line": line, "value": value, "error": error})
+
+    def iter_emails(self) -> Iterator[str]:
+        reader = csv.reader(io.TextIOWrapper(self.stream, encoding="utf-8-sig", newline=""))
+        rows = enumerate(reader, start=1)
+
+        # Use the "email" column when there is a header, otherwise the first column
+        column = 0
+        first_row = next(rows, None)
+        if first_row is None:
+            return
+        header = [cell.strip().lower() for cell in first_row[1]]
+        if "email" in header:
+            column = header.index("email")
+            chunk = []
+        else:
+            chunk = [first_row]
+
+        while True:
+            chunk.extend(islice(rows, RECIPIENT_UPLOAD_CHUNK_SIZE - len(chunk)))
+            if not chunk:
+                return
+            for line, row in chunk:
+                if not any(cell.strip() for cell in row):
+                    continue
+                value = row[column].strip() if column < len(row) else ""
+                try:
+                    yield email_adapter.validate_python(value).lower()
+                except ValidationError as e:
+                    self._add_invalid_row(line, value, e.errors(include_url=False)[0]["msg"])
+            chunk = []
+
+
+@survey_recipients_upload_post_blueprint.route(
+    "/surveys/<uuid:survey_id>/recipients/upload", methods=["POST"]
+)
+@validate_token
+def survey_recipients_upload_post(survey_id: UUID4):
+    user_id = get_user_id_from_token()
+    if not user_id:
+        return jsonify({"error": "Invalid token"}), 401
+
+    survey, error_response = get_survey_by_id(survey_id, user_id)
+    if error_response:
+        return jsonify(error_response[0]), error_response[1]
+
+    if get_survey_status(survey) == SurveyStatus.CLOSED:
+        return jsonify({"error": "Survey is closed"}), 400
+
+    # Accept a multipart "file" field or a raw text/csv body
+    if "file" in request.files:
+        stream = request.files["file"].stream
+    elif request.mimetype == "text/csv":
+        stream = io.BufferedReader(request.stream)
+    else:
+        return jsonify({"error": "CSV file required"}), 400
+
+    upload = RecipientUpload(stream)
+    valid_count = 0
+
+    def count_valid(emails: Iterator[str]) -> Iterator[str]:
+        nonlocal valid_count
+        for email in emails:
+            valid_count += 1
+            yield email
+
+    added = load_survey_recipients(survey_id, count_valid(upload.iter_emails()))
+    if added:
+        bump_survey_version(survey_id)
+    db.session.commit()
+
+    if added:
+        dispatch_new_survey_emails(survey_id)
+
+    return (
+        jsonify(
+            {
+                "added": added,
+                "duplicates": valid_count - added,
+                "invalid": upload.invalid_count,
+                "invalidRows": upload.invalid_rows,
+            }
+        ),
+        200,
+    )
+
+
+__all__ = ["survey_recipients_upload_post_blueprint"]
@@ -0,0 +1,54 @@
+from flask import Blueprint, jsonify, request
+from pydantic import UUID4
+
+from ..auth.jwt import validate_token, get_user_id_from_token
+from ..core.pagination import MAX_PAGE_SIZE, parse_page_args
+from ..core.survey_service import get_survey_by_id, get_respondent_emails
+
+survey_respondents_get_blueprint = Blueprint(
+    "survey_respondents_get_routes", __name__
+)
+
+
+@survey_respondents_get_blueprint.route(
+    "/surveys/<uuid:survey_id>/respondents", methods=["GET"]
+)
+@validate_token
+def survey_respondents_get(survey_id: UUID4):
+    user_id = get_user_id_from_token()
+    if not user_id:
+        return jsonify({"error": "Invalid token"}), 401
+
+    page_args = parse_page_args(request.args)
+    if page_args is None:
+        return (
+            jsonify(
+                {"error": f"page must be >= 1 and pageSize between 1 and {MAX_PAGE_SIZE}"}
+            ),
+            400,
+        )
+    page, page_size = page_args
+
+    survey, error_response = get_survey_by_id(survey_id, user_id)
+    if error_response:
+        return jsonify(error_response[0]), error_response[1]
+
+    if survey.is_anonymous:
+        return jsonify({"error": "Survey is anonymous"}), 400
+
+    respondent_emails, total = get_respondent_emails(survey.id, page, page_size)
+
+    return (
+        jsonify(
+            {
+                "items": respondent_emails,
+                "total": total,
+                "page": page,
+                "pageSize": page_size,
+            }
+        ),
+        200,
+    )
+
+
+__all__ = ["survey_respondents_get_blueprint"]
@@ -1,11 +1,14 @@
 from flask import Blueprint, request, jsonify
 from pydantic import EmailStr, ValidationError, Field
-from datetime import datetime, timezone
 
-from ..core.db import db
-from ..core.models import SurveyResponse, SurveyStatus, Recipient
+from ..core.batching import ResponseBatcherBusyError, submit_survey_response
+from ..core.models import SurveyStatus
 from ..core.pydantic import PydanticBaseModel
-from ..core.survey_service import get_survey_by_id_public, handle_validation_error
+from ..core.survey_service import (
+    SurveyResponseOutcome,
+    get_survey_by_id_public,
+    handle_validation_error,
+)
 
 survey_response_post_blueprint = Blueprint("survey_response_post_routes", __name__)
 
@@ -28,38 +31,28 @@ def response(survey_id):
     if error_response:
         return jsonify(error_response[0]), error_response[1]
 
-    if survey.status != SurveyStatus.ACTIVE:
+    if survey.status != SurveyStatus.ACTIVE or survey.is_expired:
         return jsonify({"error": "Survey is closed"}), 400
 
-    if data.token:
-        recipient = Recipient.query.filter_by(
-            survey_id=survey_id, response_token=data.token
-        ).first()
-        if not recipient:
-            return jsonify({"error": "Invalid or expired token"}), 400
-        recipient_email = recipient.email
-    elif data.email:
-        recipient_email = data.email
-    elif survey.is_anonymous:
-        recipient_email = None
-    else:
+    if not data.token and not data.email and not survey.is_anonymous:
         return jsonify({"error": "Token or email required"}), 400
 
-    if recipient_email:
-        existing = SurveyResponse.query.filter_by(
-            survey_id=survey_id, recipient_email=recipient_email
-        ).first()
-        if existing:
-            return jsonify({"error": "Already responded"}), 400
+    try:
+        outcome = submit_survey_response(
+            survey_id,
+            data.answer,
+            token=data.token or None,
+            email=None if data.token else data.email or None,
+        )
+    except ResponseBatcherBusyError:
+        return jsonify({"error": "Too many responses, try again later"}), 503
+    if outcome == SurveyResponseOutcome.SURVEY_CLOSED:
+        return jsonify({"error": "Survey is closed"}), 400
+    if outcome == SurveyResponseOutcome.INVALID_TOKEN:
+        return jsonify({"error": "Invalid or expired token"}), 400
+    if outcome == SurveyResponseOutcome.DUPLICATE:
+        return jsonify({"error": "Already responded"}), 400
 
-    response = SurveyResponse(
-        survey_id=survey_id,
-        recipient_email=recipient_email if recipient_email else "",
-        answer=data.answer,
-        answered_at=datetime.now(timezone.utc),
-    )
-    db.session.add(response)
-    db.session.commit()
     return jsonify({"message": "Response recorded"}), 201
 
 
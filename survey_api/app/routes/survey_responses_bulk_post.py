@@ -0,0 +1,116 @@
+import json
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple
+
+from flask import Blueprint, jsonify, request
+from pydantic import UUID4, EmailStr, Field, ValidationError, field_validator
+
+from ..auth.jwt import validate_token, get_user_id_from_token
+from ..core.pydantic import PydanticBaseModel
+from ..core.survey_service import (
+    SurveyResponseOutcome,
+    SurveyResponseSubmission,
+    get_survey_by_id,
+    record_survey_responses,
+)
+
+survey_responses_bulk_post_blueprint = Blueprint(
+    "survey_responses_bulk_post_routes", __name__
+)
+
+# Number of lines recorded per statement
+BULK_RESPONSE_CHUNK_SIZE = 1000
+
+
+class BulkSurveyResponseLine(PydanticBaseModel):
+    token: str | None = None
+    email: EmailStr | None = None
+    answer: str = Field(pattern="^(YES|NO|CANT_ANSWER)$")
+    answeredAt: datetime | None = None
+
+    @field_validator("answeredAt")
+    @classmethod
+    def answered_at_not_in_future(cls, value: datetime | None) -> datetime | None:
+        if value is None:
+            return value
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        if value > datetime.now(timezone.utc):
+            raise ValueError("answeredAt cannot be in the future")
+        return value
+
+
+def _record_chunk(
+    chunk: List[Tuple[int, SurveyResponseSubmission]], results: List[Dict]
+) -> None:
+    outcomes = record_survey_responses([submission for _, submission in chunk])
+    for (line_number, _), outcome in zip(chunk, outcomes):
+        results.append({"line": line_number, "status": outcome.value})
+
+
+@survey_responses_bulk_post_blueprint.route(
+    "/surveys/<uuid:survey_id>/responses/bulk", methods=["POST"]
+)
+@validate_token
+def survey_responses_bulk_post(survey_id: UUID4):
+    user_id = get_user_id_from_token()
+    if not user_id:
+        return jsonify({"error": "Invalid token"}), 401
+
+    survey, error_response = get_survey_by_id(survey_id, user_id)
+    if error_response:
+        return jsonify(error_response[0]), error_response[1]
+    is_anonymous = survey.is_anonymous
+
+    results: List[Dict] = []
+    chunk: List[Tuple[int, SurveyResponseSubmission]] = []
+
+    # Read the body line by line so large imports are never held in memory at once
+    for line_number, raw_line in enumerate(request.stream, start=1):
+        if not raw_line.strip():
+            continue
+
+        try:
+            line = BulkSurveyResponseLine.model_validate(json.loads(raw_line))
+        except json.JSONDecodeError:
+            results.append({"line": line_number, "status": "INVALID", "error": "Invalid JSON"})
+            continue
+        except ValidationError as e:
+            error = "; ".join(error["msg"] for error in e.errors(include_url=False))
+            results.append({"line": line_number, "status": "INVALID", "error": error})
+            continue
+
+        if not line.token and not line.email and not is_anonymous:
+            results.append(
+                {"line": line_number, "status": "INVALID", "error": "Token or email required"}
+            )
+            continue
+
+        chunk.append(
+            (
+                line_number,
+                SurveyResponseSubmission(
+                    survey_id,
+                    line.answer,
+                    token=line.token or None,
+                    email=None if line.token else line.email or None,
+                    answered_at=line.answeredAt,
+                ),
+            )
+        )
+        if len(chunk) >= BULK_RESPONSE_CHUNK_SIZE:
+            _record_chunk(chunk, results)
+            chunk = []
+
+    if chunk:
+        _record_chunk(chunk, results)
+
+    results.sort(key=lambda result: result["line"])
+    summary = {status: 0 for status in ["INVALID", *(o.value for o in SurveyResponseOutcome)]}
+    for result in results:
+        summary[result["status"]] += 1
+
+    return jsonify({"results": results, "summary": summary}), 200
+
+
+__all__ = ["survey_responses_bulk_post_blueprint"]
@@ -0,0 +1,80 @@
+import csv
+import io
+import json
+from typing import Dict, Iterator
+
+from flask import Blueprint, Response, jsonify, request, stream_with_context
+from pydantic import UUID4
+
+from ..auth.jwt import validate_token, get_user_id_from_token
+from ..core.models import Survey
+from ..core.survey_service import iter_detailed_responses
+
+survey_results_export_get_blueprint = Blueprint(
+    "survey_results_export_get_routes", __name__
+)
+
+EXPORT_COLUMNS = ["respondentEmail", "answer", "answeredAt"]
+EXPORT_MIMETYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _format_row(response_info: Dict) -> Dict:
+    return {
+        "respondentEmail": response_info["respondentEmail"],
+        "answer": response_info["answer"],
+        "answeredAt": response_info["answeredAt"].isoformat(),
+    }
+
+
+def _generate_csv(survey: Survey) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS)
+    writer.writeheader()
+    for response_info in iter_detailed_responses(survey):
+        writer.writerow(_format_row(response_info))
+
+        # Flush the buffer once it holds a reasonably sized chunk
+        if buffer.tell() >= 64 * 1024:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _generate_ndjson(survey: Survey) -> Iterator[str]:
+    for response_info in iter_detailed_responses(survey):
+        yield json.dumps(_format_row(response_info)) + "\n"
+
+
+@survey_results_export_get_blueprint.route(
+    "/surveys/<uuid:survey_id>/results/export", methods=["GET"]
+)
+@validate_token
+def survey_results_export_get(survey_id: UUID4):
+    user_id = get_user_id_from_token()
+    if not user_id:
+        return jsonify({"error": "Invalid token"}), 401
+
+    export_format = request.args.get("format", "csv").lower()
+    if export_format not in EXPORT_MIMETYPES:
+        return jsonify({"error": "Format must be one of: csv, ndjson"}), 400
+
+    survey = Survey.query.filter_by(id=survey_id, owner_id=user_id).first()
+    if not survey:
+        return jsonify({"error": "Survey not found"}), 404
+
+    generate = _generate_csv if export_format == "csv" else _generate_ndjson
+
+    return Response(
+        stream_with_context(generate(survey)),
+        mimetype=EXPORT_MIMETYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="survey-{survey.id}-results.{export_format}"'
+        },
+    )
+
+
+__all__ = ["survey_results_export_get_blueprint"]
@@ -1,11 +1,22 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 from pydantic import UUID4, EmailStr
 from datetime import datetime
+from typing import Optional
 
 from ..auth.jwt import validate_token, get_user_id_from_token
-from ..core.models import Survey, SurveyAnswer
+from ..core.models import Survey
 from ..core.pydantic import PydanticBaseModel
-from ..core.survey_service import get_detailed_responses
+from ..core.pagination import MAX_PAGE_SIZE, decode_cursor, encode_cursor
+from ..core.survey_service import (
+    get_daily_response_counts,
+    get_detailed_responses_page,
+    get_surveys_result_counts,
+)
+from ..core.versioning import (
+    get_survey_version,
+    make_survey_etag,
+    not_modified_response,
+)
 
 survey_results_get_blueprint = Blueprint("survey_results_get_routes", __name__)
 
@@ -16,11 +27,21 @@ class SurveyResponseInfo(PydanticBaseModel):
     answeredAt: datetime
 
 
+class DailyResponseCount(PydanticBaseModel):
+    date: str
+    count: int
+
+
 class SurveyResultsGetResponse(PydanticBaseModel):
     surveyId: UUID4
     results: dict
     totalResponses: int
+    dailyCounts: list[DailyResponseCount]
+    # One page of responses in answer order, follow nextCursor for the next
+    # one. Full dumps go through /results/export
     responses: list[SurveyResponseInfo]
+    nextCursor: Optional[str]
+    pageSize: int
 
 
 @validate_token
@@ -30,22 +51,38 @@ def survey_results_get(survey_id):
     if not user_id:
         return jsonify({"error": "Invalid token"}), 401
 
+    try:
+        page_size = int(request.args.get("pageSize", 20))
+    except ValueError:
+        page_size = 0
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        return (
+            jsonify({"error": f"pageSize must be between 1 and {MAX_PAGE_SIZE}"}),
+            400,
+        )
+    cursor = None
+    encoded_cursor = request.args.get("cursor")
+    if encoded_cursor:
+        cursor = decode_cursor(encoded_cursor)
+        if not cursor:
+            return jsonify({"error": "Invalid cursor"}), 400
+
+    if request.if_none_match:
+        version = get_survey_version(survey_id, user_id)
+        if version is not None:
+            response = not_modified_response(
+                make_survey_etag("results", survey_id, version)
+            )
+            if response:
+                return response
+
     survey = Survey.query.filter_by(id=survey_id, owner_id=user_id).first()
     if not survey:
         return jsonify({"error": "Survey not found"}), 404
 
-    results = {
-        SurveyAnswer.YES.value: 0,
-        SurveyAnswer.NO.value: 0,
-        SurveyAnswer.CANT_ANSWER.value: 0,
-    }
-
-    responses = get_detailed_responses(survey)
+    results = get_surveys_result_counts([survey.id])[survey.id]
 
-    for response_info in responses:
-        answer = response_info["answer"]
-        if answer in results:
-            results[answer] += 1
+    responses, next_cursor = get_detailed_responses_page(survey, page_size, cursor)
 
     total_responses = sum(results.values())
 
@@ -53,10 +90,15 @@ def survey_results_get(survey_id):
         surveyId=survey.id,
         results=results,
         totalResponses=total_responses,
+        dailyCounts=get_daily_response_counts(survey.id),
         responses=responses,
+        nextCursor=encode_cursor(next_cursor) if next_cursor else None,
+        pageSize=page_size,
     )
 
-    return jsonify(response_data.model_dump()), 200
+    response = jsonify(response_data.model_dump())
+    response.set_etag(make_survey_etag("results", survey.id, survey.version))
+    return response, 200
 
 
 __all__ = ["survey_results_get_blueprint"]
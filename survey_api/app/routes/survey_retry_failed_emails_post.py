@@ -3,7 +3,11 @@ from pydantic import UUID4
 
 from ..auth.jwt import validate_token, get_user_id_from_token
 from ..core.models import SurveyStatus
-from ..core.survey_service import get_survey_by_id, retry_failed_survey_emails
+from ..core.survey_service import (
+    get_survey_by_id,
+    get_survey_status,
+    retry_failed_survey_emails,
+)
 
 survey_retry_failed_emails_post_blueprint = Blueprint(
     "survey_retry_failed_emails_post_routes", __name__
@@ -23,7 +27,7 @@ def survey_retry_failed_emails_post(survey_id: UUID4):
     if error_response:
         return jsonify(error_response[0]), error_response[1]
 
-    if survey.status == SurveyStatus.CLOSED.value:
+    if get_survey_status(survey) == SurveyStatus.CLOSED:
         return jsonify({"error": "Survey is closed"}), 400
 
     retry_failed_survey_emails(survey_id)
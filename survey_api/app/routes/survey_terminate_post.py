@@ -2,6 +2,7 @@ from flask import Blueprint, jsonify
 from pydantic import UUID4
 
 from ..auth.jwt import validate_token, get_user_id_from_token
+from ..core.models import SurveyStatus
 from ..core.survey_service import get_survey_by_id, terminate_survey
 
 survey_terminate_post_blueprint = Blueprint("survey_terminate_post_routes", __name__)
@@ -20,7 +21,7 @@ def survey_terminate_post(survey_id: UUID4):
     if error_response:
         return jsonify(error_response[0]), error_response[1]
 
-    if survey.status == "CLOSED":
+    if survey.status == SurveyStatus.CLOSED:
         return jsonify({"error": "Survey is already closed"}), 400
 
     terminate_survey(survey)
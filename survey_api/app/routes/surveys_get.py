@@ -1,17 +1,27 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List
 
 from flask import Blueprint, jsonify, request
-from pydantic import EmailStr, UUID4
+from pydantic import UUID4
+from sqlalchemy import tuple_
 
 from ..auth.jwt import validate_token, get_user_id_from_token
 from ..core.models import Survey
+from ..core.pagination import (
+    MAX_PAGE_SIZE,
+    Cursor,
+    decode_cursor,
+    encode_cursor,
+    parse_page_args,
+)
 from ..core.pydantic import PydanticBaseModel
 from ..core.survey_service import (
     EmailStatusSummary,
-    get_survey_results,
-    get_email_status_summary,
-    check_and_update_survey_status,
+    get_email_status_summaries,
+    get_surveys_recipient_counts,
+    get_surveys_result_counts,
+    get_survey_status,
+    search_surveys,
 )
 
 surveys_get_blueprint = Blueprint("surveys_get_routes", __name__)
@@ -23,12 +33,12 @@ class SurveysGetResponse(PydanticBaseModel):
     question: str
     endDate: datetime
     isAnonymous: bool
-    recipients: List[EmailStr]
+    recipientCount: int
     status: str
     createdAt: datetime
     updatedAt: datetime
     results: dict
-    respondentEmails: Optional[List[EmailStr]]
+    totalResponses: int
     emailStatusSummary: EmailStatusSummary
 
 
@@ -40,30 +50,75 @@ def surveys_get():
         return jsonify({"error": "Invalid token"}), 401
 
     name = request.args.get("name", "")
-    page = int(request.args.get("page", 1))
-    page_size = int(request.args.get("pageSize", 20))
+    search = request.args.get("search", "").strip()
+    search_question = request.args.get("searchQuestion", "").lower() == "true"
+    page_args = parse_page_args(request.args)
+    if page_args is None:
+        return (
+            jsonify(
+                {"error": f"page must be >= 1 and pageSize between 1 and {MAX_PAGE_SIZE}"}
+            ),
+            400,
+        )
+    page, page_size = page_args
+
+    # Passing "cursor" (empty for the first page) switches to keyset pagination
+    is_cursor_mode = "cursor" in request.args
+    include_total = request.args.get("includeTotal", "").lower() == "true"
+    if search and is_cursor_mode:
+        return (
+            jsonify({"error": "Cursor pagination is not supported with search"}),
+            400,
+        )
 
     query = Survey.query.filter_by(owner_id=user_id)
     if name:
         query = query.filter(Survey.name.ilike(f"%{name}%"))
 
-    total = query.count()
-    surveys: List[Survey] = (
-        query.order_by(Survey.created_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .all()
-    )
+    if search:
+        # Ranked search mode, most relevant surveys first
+        query = search_surveys(query, search, search_question)
+
+    total = query.count() if not is_cursor_mode or include_total else None
+
+    if not search:
+        query = query.order_by(Survey.created_at.desc(), Survey.id.desc())
+    next_cursor = None
+    if is_cursor_mode:
+        encoded_cursor = request.args.get("cursor")
+        if encoded_cursor:
+            cursor = decode_cursor(encoded_cursor)
+            if not cursor:
+                return jsonify({"error": "Invalid cursor"}), 400
+            query = query.filter(
+                tuple_(Survey.created_at, Survey.id) < (cursor.created_at, cursor.id)
+            )
+
+        # Fetch one extra row to know whether there is a next page
+        surveys: List[Survey] = query.limit(page_size + 1).all()
+        if len(surveys) > page_size:
+            surveys = surveys[:page_size]
+            next_cursor = encode_cursor(
+                Cursor(created_at=surveys[-1].created_at, id=surveys[-1].id)
+            )
+    else:
+        surveys: List[Survey] = (
+            query.offset((page - 1) * page_size).limit(page_size).all()
+        )
+
+    # Aggregate the whole page at once instead of querying per survey. Only
+    # counts are listed, the emails are paged by /surveys/<id>/recipients and
+    # /surveys/<id>/respondents
+    survey_ids = [survey.id for survey in surveys]
+    recipient_counts = get_surveys_recipient_counts(survey_ids)
+    result_counts = get_surveys_result_counts(survey_ids)
+    email_status_summaries = get_email_status_summaries(survey_ids)
 
     result = []
     for survey in surveys:
-        check_and_update_survey_status(survey)
-
-        recipient_emails = [r.email for r in survey.recipients_list]
-
-        results, respondent_emails = get_survey_results(survey)
+        results = result_counts[survey.id]
 
-        email_status_summary = get_email_status_summary(survey.id)
+        email_status_summary = email_status_summaries[survey.id]
 
         survey_response = SurveysGetResponse(
             id=survey.id,
@@ -71,16 +126,27 @@ def surveys_get():
             question=survey.question,
             endDate=survey.end_date,
             isAnonymous=survey.is_anonymous,
-            recipients=recipient_emails,
-            status=survey.status,
+            recipientCount=recipient_counts[survey.id],
+            status=get_survey_status(survey).value,
             createdAt=survey.created_at,
             updatedAt=survey.updated_at,
             results=results,
-            respondentEmails=respondent_emails if not survey.is_anonymous else None,
+            totalResponses=sum(results.values()),
             emailStatusSummary=email_status_summary,
         )
         result.append(survey_response.model_dump())
 
+    if is_cursor_mode:
+        response_data = {
+            "items": result,
+            "nextCursor": next_cursor,
+            "pageSize": page_size,
+        }
+        if total is not None:
+            response_data["total"] = total
+
+        return jsonify(response_data), 200
+
     return (
         jsonify(
             {
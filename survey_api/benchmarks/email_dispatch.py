@@ -0,0 +1,52 @@
+"""Compare serial and asyncio email dispatch against the configured email API.
+
+Sends the same number of emails once through the blocking EmailSender (one at a
+time, as send_survey_emails does) and once through AsyncEmailDispatcher, and
+prints emails/second for both. Point EMAIL_PROVIDER/EMAIL_API_URL at the local
+email_api (or a sandbox) before running.
+
+Usage: python -m benchmarks.email_dispatch [--emails N] [--concurrency N]
+"""
+
+import argparse
+import time
+
+from app.app import app
+from app.core.email_dispatcher import AsyncEmailDispatcher, EmailJob
+from app.core.email_sender import get_email_sender
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--emails", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--recipient", default="benchmark@example.com")
+    args = parser.parse_args()
+
+    with app.app_context():
+        email_sender = get_email_sender()
+        jobs = [
+            EmailJob(args.recipient, f"Email dispatch benchmark {i}", "<p>Benchmark</p>")
+            for i in range(args.emails)
+        ]
+
+        started = time.perf_counter()
+        for job in jobs:
+            email_sender.send_email(job.recipient_email, job.subject, job.body)
+        serial = time.perf_counter() - started
+        print(f"  serial: {args.emails} emails in {serial:.2f}s ({args.emails / serial:.0f}/s)")
+
+        dispatcher = AsyncEmailDispatcher(email_sender, concurrency=args.concurrency)
+        started = time.perf_counter()
+        errors = dispatcher.send_all(jobs)
+        concurrent = time.perf_counter() - started
+        failed = sum(error is not None for error in errors)
+        print(
+            f"   async: {args.emails} emails in {concurrent:.2f}s ({args.emails / concurrent:.0f}/s), "
+            f"concurrency {args.concurrency}, {failed} failed"
+        )
+        print(f" speedup: {serial / concurrent:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
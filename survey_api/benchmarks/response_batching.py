@@ -0,0 +1,83 @@
+"""Measure public survey response throughput with and without group commits.
+
+Creates a throwaway anonymous survey, records the same number of responses from
+concurrent threads once directly (one commit per response) and once through the
+ResponseBatcher, prints responses/second for both, then deletes the survey.
+
+Usage: python -m benchmarks.response_batching [--responses N] [--threads N]
+"""
+
+import argparse
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from app.app import app
+from app.core.batching import ResponseBatcher
+from app.core.db import db
+from app.core.models import Survey
+from app.core.survey_service import SurveyResponseSubmission, record_survey_response
+
+
+def _run(label, record, responses, threads):
+    def worker(_):
+        with app.app_context():
+            try:
+                return record()
+            finally:
+                db.session.remove()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(worker, range(responses)))
+    elapsed = time.perf_counter() - started
+    print(f"{label:>10}: {responses} responses in {elapsed:.2f}s ({responses / elapsed:.0f}/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--responses", type=int, default=5000)
+    parser.add_argument("--threads", type=int, default=64)
+    parser.add_argument("--max-batch-size", type=int, default=100)
+    parser.add_argument("--max-latency-ms", type=float, default=5)
+    args = parser.parse_args()
+
+    with app.app_context():
+        survey = Survey(
+            name="Response batching benchmark",
+            question="Benchmark?",
+            end_date=datetime.now(timezone.utc) + timedelta(hours=1),
+            is_anonymous=True,
+            owner_id=uuid.uuid4(),
+        )
+        db.session.add(survey)
+        db.session.commit()
+        survey_id = survey.id
+
+    batcher = ResponseBatcher(
+        app, max_batch_size=args.max_batch_size, max_latency=args.max_latency_ms / 1000
+    )
+    try:
+        _run(
+            "direct",
+            lambda: record_survey_response(survey_id, "YES"),
+            args.responses,
+            args.threads,
+        )
+        _run(
+            "batched",
+            lambda: batcher.submit(SurveyResponseSubmission(survey_id, "YES")),
+            args.responses,
+            args.threads,
+        )
+        stats = batcher.stats()
+        print(f"   batches: {stats['batches']} (avg {stats['rows'] / max(stats['batches'], 1):.1f} rows)")
+    finally:
+        with app.app_context():
+            db.session.delete(db.session.get(Survey, survey_id))
+            db.session.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""Add survey version
+
+Revision ID: 3e5a0d9c7b14
+Revises: b91c4e7d5a28
+Create Date: 2026-10-18 12:26:55.104382
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "3e5a0d9c7b14"
+down_revision = "b91c4e7d5a28"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("survey", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("version", sa.Integer(), server_default="1", nullable=False)
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("survey", schema=None) as batch_op:
+        batch_op.drop_column("version")
@@ -0,0 +1,52 @@
+"""Add survey result counters
+
+Revision ID: 4b7e2c9a1f03
+Revises: dfd66ed42c57
+Create Date: 2026-10-18 10:12:31.518204
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "4b7e2c9a1f03"
+down_revision = "dfd66ed42c57"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "survey_result_counters",
+        sa.Column("survey_id", sa.UUID(), nullable=False),
+        sa.Column("yes", sa.Integer(), nullable=False),
+        sa.Column("no", sa.Integer(), nullable=False),
+        sa.Column("cant_answer", sa.Integer(), nullable=False),
+        sa.Column("total", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["survey_id"],
+            ["survey.id"],
+        ),
+        sa.PrimaryKeyConstraint("survey_id"),
+    )
+
+    # Backfill the counters from the existing responses
+    op.execute(
+        """
+        INSERT INTO survey_result_counters (survey_id, yes, no, cant_answer, total)
+        SELECT
+            survey_id,
+            COUNT(*) FILTER (WHERE answer = 'YES'),
+            COUNT(*) FILTER (WHERE answer = 'NO'),
+            COUNT(*) FILTER (WHERE answer = 'CANT_ANSWER'),
+            COUNT(*)
+        FROM survey_response
+        GROUP BY survey_id
+        """
+    )
+
+
+def downgrade():
+    op.drop_table("survey_result_counters")
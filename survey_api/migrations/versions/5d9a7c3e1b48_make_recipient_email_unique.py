@@ -0,0 +1,127 @@
+"""Make recipient email unique per survey
+
+Concurrent uploads could add the same address to a survey twice. Every
+duplicate recipient row got its own invite (the task join fans out over them),
+so all of their response tokens may be in someone's inbox. One row per address
+is kept in recipient, and the tokens of the others move to recipient_token_alias,
+which the response lookup also reads, so no emailed link is invalidated.
+
+Duplicate email tasks of an address are removed too, keeping a SENT task over a
+PENDING one over a FAILED one, so the remaining recipient is not emailed again.
+Removed tasks are not restored by the downgrade.
+
+Revision ID: 5d9a7c3e1b48
+Revises: e4b6c1d8f2a7
+Create Date: 2026-10-19 09:14:52.206731
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "5d9a7c3e1b48"
+down_revision = "e4b6c1d8f2a7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "recipient_token_alias",
+        sa.Column("response_token", sa.String(length=64), nullable=False),
+        sa.Column("survey_id", sa.UUID(), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.ForeignKeyConstraint(["survey_id"], ["survey.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("response_token"),
+        if_not_exists=True,
+    )
+    # Which duplicate is kept does not matter, every token stays valid
+    op.execute(
+        """
+        WITH duplicate AS (
+            DELETE FROM recipient AS duplicate
+            USING recipient AS original
+            WHERE duplicate.survey_id = original.survey_id
+              AND duplicate.email = original.email
+              AND duplicate.id > original.id
+            RETURNING duplicate.response_token, duplicate.survey_id, duplicate.email
+        )
+        INSERT INTO recipient_token_alias (response_token, survey_id, email)
+        SELECT response_token, survey_id, email FROM duplicate
+        ON CONFLICT (response_token) DO NOTHING
+        """
+    )
+    # Keep one task per address: a SENT one if it was sent, otherwise one that
+    # is still PENDING, otherwise one FAILED task the retry endpoint can reset
+    op.execute(
+        """
+        WITH ranked AS (
+            SELECT
+                id,
+                row_number() OVER (
+                    PARTITION BY survey_id, recipient_email
+                    ORDER BY
+                        CASE status
+                            WHEN 'SENT' THEN 0
+                            WHEN 'PENDING' THEN 1
+                            ELSE 2
+                        END,
+                        id
+                ) AS rank
+            FROM email_task
+        )
+        DELETE FROM email_task
+        USING ranked
+        WHERE email_task.id = ranked.id
+          AND ranked.rank > 1
+          AND email_task.status <> 'SENT'
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        # An interrupted CONCURRENTLY build leaves an INVALID index behind
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS uq_recipient_survey_id_email")
+        op.create_index(
+            "uq_recipient_survey_id_email",
+            "recipient",
+            ["survey_id", "email"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+        # Covered by the unique index
+        op.drop_index(
+            "ix_recipient_survey_id_email",
+            table_name="recipient",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_recipient_survey_id_email")
+        op.create_index(
+            "ix_recipient_survey_id_email",
+            "recipient",
+            ["survey_id", "email"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "uq_recipient_survey_id_email",
+            table_name="recipient",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    # The merged tokens become recipient rows of their own again
+    op.execute(
+        """
+        INSERT INTO recipient (id, survey_id, email, response_token)
+        SELECT gen_random_uuid(), survey_id, email, response_token
+        FROM recipient_token_alias
+        """
+    )
+    op.drop_table("recipient_token_alias")
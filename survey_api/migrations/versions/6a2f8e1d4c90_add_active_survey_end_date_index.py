@@ -0,0 +1,41 @@
+"""Add active survey end date index
+
+Revision ID: 6a2f8e1d4c90
+Revises: 3e5a0d9c7b14
+Create Date: 2026-10-18 13:08:12.661043
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "6a2f8e1d4c90"
+down_revision = "3e5a0d9c7b14"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        # An interrupted CONCURRENTLY build leaves an INVALID index behind
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_survey_active_end_date")
+        op.create_index(
+            "ix_survey_active_end_date",
+            "survey",
+            ["end_date"],
+            unique=False,
+            postgresql_where=sa.text("status = 'ACTIVE'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_survey_active_end_date",
+            table_name="survey",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
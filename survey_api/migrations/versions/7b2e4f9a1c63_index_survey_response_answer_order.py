@@ -0,0 +1,56 @@
+"""Index survey responses in answer order
+
+Revision ID: 7b2e4f9a1c63
+Revises: 5d9a7c3e1b48
+Create Date: 2026-10-19 11:02:37.518204
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "7b2e4f9a1c63"
+down_revision = "5d9a7c3e1b48"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        # An interrupted CONCURRENTLY build leaves an INVALID index behind
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_survey_response_survey_id_answered_at"
+        )
+        op.create_index(
+            "ix_survey_response_survey_id_answered_at",
+            "survey_response",
+            ["survey_id", "answered_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        # Covered by the new index
+        op.drop_index(
+            "ix_survey_response_survey_id",
+            table_name="survey_response",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_survey_response_survey_id")
+        op.create_index(
+            "ix_survey_response_survey_id",
+            "survey_response",
+            ["survey_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_survey_response_survey_id_answered_at",
+            table_name="survey_response",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
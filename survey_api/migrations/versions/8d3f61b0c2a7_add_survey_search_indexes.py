@@ -0,0 +1,76 @@
+"""Add survey search indexes
+
+Revision ID: 8d3f61b0c2a7
+Revises: 4b7e2c9a1f03
+Create Date: 2026-10-18 11:03:47.220915
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "8d3f61b0c2a7"
+down_revision = "4b7e2c9a1f03"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Adding a STORED generated column rewrites the survey table under an
+    # ACCESS EXCLUSIVE lock, so reads and writes of surveys wait for it
+    with op.batch_alter_table("survey", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "question_tsv",
+                postgresql.TSVECTOR(),
+                sa.Computed("to_tsvector('simple', question)", persisted=True),
+                nullable=True,
+            )
+        )
+
+    # The GIN builds are the slow part and do not block writes
+    with op.get_context().autocommit_block():
+        # An interrupted CONCURRENTLY build leaves an INVALID index behind
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_survey_name_trgm")
+        op.create_index(
+            "ix_survey_name_trgm",
+            "survey",
+            ["name"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_survey_question_tsv")
+        op.create_index(
+            "ix_survey_question_tsv",
+            "survey",
+            ["question_tsv"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_survey_question_tsv",
+            table_name="survey",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_survey_name_trgm",
+            table_name="survey",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    with op.batch_alter_table("survey", schema=None) as batch_op:
+        batch_op.drop_column("question_tsv")
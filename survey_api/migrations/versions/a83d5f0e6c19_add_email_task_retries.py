@@ -0,0 +1,58 @@
+"""Add email task retries
+
+Revision ID: a83d5f0e6c19
+Revises: f2a9b3c5d871
+Create Date: 2026-10-18 19:12:47.305618
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a83d5f0e6c19"
+down_revision = "f2a9b3c5d871"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("email_task", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("attempts", sa.Integer(), server_default="0", nullable=False)
+        )
+        batch_op.add_column(
+            sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=True)
+        )
+        batch_op.add_column(sa.Column("last_error", sa.Text(), nullable=True))
+
+    with op.get_context().autocommit_block():
+        # An interrupted CONCURRENTLY build leaves an INVALID index behind
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_email_task_pending_next_attempt_at"
+        )
+        op.create_index(
+            "ix_email_task_pending_next_attempt_at",
+            "email_task",
+            ["next_attempt_at"],
+            unique=False,
+            postgresql_ops={"next_attempt_at": "NULLS FIRST"},
+            postgresql_where=sa.text("status = 'PENDING'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_email_task_pending_next_attempt_at",
+            table_name="email_task",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    with op.batch_alter_table("email_task", schema=None) as batch_op:
+        batch_op.drop_column("last_error")
+        batch_op.drop_column("next_attempt_at")
+        batch_op.drop_column("attempts")
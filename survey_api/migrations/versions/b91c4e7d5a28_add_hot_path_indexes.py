@@ -0,0 +1,153 @@
+"""Add hot path indexes
+
+Revision ID: b91c4e7d5a28
+Revises: 8d3f61b0c2a7
+Create Date: 2026-10-18 11:41:09.732415
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b91c4e7d5a28"
+down_revision = "8d3f61b0c2a7"
+branch_labels = None
+depends_on = None
+
+
+TABLES = ["survey", "survey_response", "recipient", "email_task"]
+
+RECOUNT_SURVEY_RESULTS_STATEMENTS = [
+    "DELETE FROM survey_result_counters",
+    """
+    INSERT INTO survey_result_counters (survey_id, yes, no, cant_answer, total)
+    SELECT
+        survey_id,
+        COUNT(*) FILTER (WHERE answer = 'YES'),
+        COUNT(*) FILTER (WHERE answer = 'NO'),
+        COUNT(*) FILTER (WHERE answer = 'CANT_ANSWER'),
+        COUNT(*)
+    FROM survey_response
+    GROUP BY survey_id
+    """,
+]
+
+
+def _recreate_index(name, table, columns, **kwargs):
+    # An interrupted CONCURRENTLY build leaves an INVALID index behind, which
+    # if_not_exists would keep
+    op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    op.create_index(name, table, columns, postgresql_concurrently=True, **kwargs)
+
+
+def upgrade():
+    # Keep the first answer of each duplicate named response so the unique
+    # index can be built, and move the others to a backup table the downgrade
+    # restores. Then recount the result counters they affected
+    op.execute(
+        "CREATE TABLE IF NOT EXISTS survey_response_duplicate_backup "
+        "(LIKE survey_response)"
+    )
+    op.execute(
+        """
+        WITH duplicate AS (
+            DELETE FROM survey_response AS duplicate
+            USING survey_response AS original
+            WHERE duplicate.survey_id = original.survey_id
+              AND duplicate.recipient_email = original.recipient_email
+              AND duplicate.recipient_email <> ''
+              AND (duplicate.answered_at, duplicate.id)
+                  > (original.answered_at, original.id)
+            RETURNING duplicate.*
+        )
+        INSERT INTO survey_response_duplicate_backup SELECT * FROM duplicate
+        """
+    )
+    for statement in RECOUNT_SURVEY_RESULTS_STATEMENTS:
+        op.execute(statement)
+
+    # The primary keys are already unique, the extra UNIQUE(id) indexes (created
+    # twice by earlier migrations) only add write amplification
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {table}_id_key")
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {table}_id_key1")
+
+    # Build the indexes without blocking writes, which cannot run in a transaction
+    with op.get_context().autocommit_block():
+        _recreate_index(
+            "ix_survey_response_survey_id",
+            "survey_response",
+            ["survey_id"],
+            unique=False,
+        )
+        _recreate_index(
+            "uq_survey_response_survey_id_recipient_email",
+            "survey_response",
+            ["survey_id", "recipient_email"],
+            unique=True,
+            postgresql_where=sa.text("recipient_email <> ''"),
+        )
+        _recreate_index(
+            "ix_email_task_survey_id_status",
+            "email_task",
+            ["survey_id", "status"],
+            unique=False,
+        )
+        _recreate_index(
+            "ix_recipient_survey_id_email",
+            "recipient",
+            ["survey_id", "email"],
+            unique=False,
+        )
+        _recreate_index(
+            "ix_survey_owner_id_created_at",
+            "survey",
+            ["owner_id", "created_at", "id"],
+            unique=False,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_survey_owner_id_created_at",
+            table_name="survey",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_recipient_survey_id_email",
+            table_name="recipient",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_email_task_survey_id_status",
+            table_name="email_task",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "uq_survey_response_survey_id_recipient_email",
+            table_name="survey_response",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_survey_response_survey_id",
+            table_name="survey_response",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    for table in TABLES:
+        op.create_unique_constraint(f"{table}_id_key", table, ["id"])
+
+    op.execute(
+        "INSERT INTO survey_response SELECT * FROM survey_response_duplicate_backup"
+    )
+    op.drop_table("survey_response_duplicate_backup")
+    for statement in RECOUNT_SURVEY_RESULTS_STATEMENTS:
+        op.execute(statement)
@@ -0,0 +1,55 @@
+"""Add survey ended email pending
+
+Revision ID: c3f8a2d6e914
+Revises: 7b2e4f9a1c63
+Create Date: 2026-10-19 13:26:05.734190
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c3f8a2d6e914"
+down_revision = "7b2e4f9a1c63"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # A constant default is stored in the catalog, the table is not rewritten
+    with op.batch_alter_table("survey", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "ended_email_pending",
+                sa.Boolean(),
+                server_default=sa.text("false"),
+                nullable=False,
+            )
+        )
+
+    with op.get_context().autocommit_block():
+        # An interrupted CONCURRENTLY build leaves an INVALID index behind
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_survey_ended_email_pending")
+        op.create_index(
+            "ix_survey_ended_email_pending",
+            "survey",
+            ["id"],
+            unique=False,
+            postgresql_where=sa.text("ended_email_pending"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_survey_ended_email_pending",
+            table_name="survey",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    with op.batch_alter_table("survey", schema=None) as batch_op:
+        batch_op.drop_column("ended_email_pending")
@@ -0,0 +1,70 @@
+"""Add contact lists
+
+Revision ID: c7d1e4a92b63
+Revises: 6a2f8e1d4c90
+Create Date: 2026-10-18 18:21:40.318275
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c7d1e4a92b63"
+down_revision = "6a2f8e1d4c90"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "contact_list",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("owner_id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_contact_list_owner_id_created_at",
+        "contact_list",
+        ["owner_id", "created_at"],
+        unique=False,
+    )
+    op.create_table(
+        "contact",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("contact_list_id", sa.UUID(), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["contact_list_id"], ["contact_list.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "uq_contact_contact_list_id_email",
+        "contact",
+        ["contact_list_id", "email"],
+        unique=True,
+    )
+    with op.batch_alter_table("survey", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("contact_list_id", sa.UUID(), nullable=True))
+        batch_op.create_foreign_key(
+            "survey_contact_list_id_fkey",
+            "contact_list",
+            ["contact_list_id"],
+            ["id"],
+            ondelete="SET NULL",
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("survey", schema=None) as batch_op:
+        batch_op.drop_constraint("survey_contact_list_id_fkey", type_="foreignkey")
+        batch_op.drop_column("contact_list_id")
+    op.drop_index("uq_contact_contact_list_id_email", table_name="contact")
+    op.drop_table("contact")
+    op.drop_index("ix_contact_list_owner_id_created_at", table_name="contact_list")
+    op.drop_table("contact_list")
@@ -0,0 +1,31 @@
+"""Add email rate limit
+
+Revision ID: e4b6c1d8f2a7
+Revises: a83d5f0e6c19
+Create Date: 2026-10-18 20:05:31.418265
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e4b6c1d8f2a7"
+down_revision = "a83d5f0e6c19"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "email_rate_limit",
+        sa.Column("provider", sa.String(length=64), nullable=False),
+        sa.Column("tokens", sa.Float(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("provider"),
+    )
+
+
+def downgrade():
+    op.drop_table("email_rate_limit")
@@ -0,0 +1,31 @@
+"""Add email task lease
+
+Revision ID: f2a9b3c5d871
+Revises: c7d1e4a92b63
+Create Date: 2026-10-18 18:46:03.927514
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "f2a9b3c5d871"
+down_revision = "c7d1e4a92b63"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("email_task", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True)
+        )
+        batch_op.add_column(sa.Column("locked_by", sa.String(length=255), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table("email_task", schema=None) as batch_op:
+        batch_op.drop_column("locked_by")
+        batch_op.drop_column("locked_until")
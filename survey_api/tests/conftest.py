@@ -0,0 +1,34 @@
+import os
+import uuid
+
+import pytest
+
+# Configure the app before it is imported, the routes under test reject the
+# request before touching the database
+os.environ.setdefault("FLASK_WEB_ORIGIN", "http://localhost:3000")
+os.environ.setdefault("FLASK_SECRET_KEY", "test-secret")
+os.environ.setdefault("FLASK_SQLALCHEMY_DATABASE_URI", "sqlite://")
+os.environ.setdefault("FLASK_EMAIL_WORKER_MODE", "sync")
+os.environ.setdefault("FLASK_EXPIRY_SWEEP_INTERVAL", "0")
+os.environ.setdefault("FLASK_EMAIL_RETRY_SWEEP_INTERVAL", "0")
+
+from app.app import app as flask_app  # noqa: E402
+from app.auth.jwt import generate_jwt  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    flask_app.config["TESTING"] = True
+    return flask_app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def auth_headers(app):
+    with app.app_context():
+        token = generate_jwt(str(uuid.uuid4()))
+    return {"Authorization": f"Bearer {token}"}
@@ -0,0 +1,23 @@
+import uuid
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "page=abc",
+        "pageSize=abc",
+        "page=0",
+        "page=-1",
+        "pageSize=0",
+        "pageSize=101",
+    ],
+)
+def test_invalid_page_args_return_400(client, auth_headers, query):
+    response = client.get(
+        f"/api/contact-lists/{uuid.uuid4()}/contacts?{query}", headers=auth_headers
+    )
+
+    assert response.status_code == 400
+    assert "pageSize between 1 and 100" in response.get_json()["error"]
@@ -0,0 +1,17 @@
+def test_metrics_requires_a_token(client):
+    response = client.get("/metrics")
+
+    assert response.status_code == 401
+
+
+def test_metrics_rejects_an_invalid_token(client):
+    response = client.get("/metrics", headers={"Authorization": "Bearer not-a-token"})
+
+    assert response.status_code == 401
+
+
+def test_metrics_with_a_token(client, auth_headers):
+    response = client.get("/metrics", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert "publicSurveyCache" in response.get_json()
@@ -1,10 +1,10 @@
 "use client";
 
 import React from "react";
-import { Survey } from "../../../_lib/models";
+import { SurveyDetail } from "../../../_lib/models";
 import { StatusBadge } from "../../../_components/StatusBadge";
 
-export default function SurveyDetails({ survey }: { survey: Survey }) {
+export default function SurveyDetails({ survey }: { survey: SurveyDetail }) {
 	return (
 		<section className="bg-white border p-6 mb-8">
 			<div className="mb-4">
@@ -31,13 +31,7 @@ export default function SurveyDetails({ survey }: { survey: Survey }) {
 				<div className="flex flex-row justify-between items-center">
 					<dt className="font-semibold text-gray-600">Recipients</dt>
 					<dd className="truncate max-w-[70%] text-right">
-						{Array.isArray(survey.recipients)
-							? survey.recipients.length > 0
-								? survey.recipients.join(", ")
-								: "None"
-							: survey.recipients
-								? survey.recipients
-								: "None"}
+						{survey.recipientCount > 0 ? survey.recipientCount : "None"}
 					</dd>
 				</div>
 			</dl>
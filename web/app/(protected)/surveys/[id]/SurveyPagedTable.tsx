@@ -0,0 +1,113 @@
+"use client";
+
+import React, { useEffect, useState } from "react";
+import { Paginated } from "../../../_lib/models";
+import Pagination from "../../../_components/Pagination";
+import Loading from "../../../_components/Loading";
+
+const PAGE_SIZE = 20;
+
+type SurveyPagedTableProps<T> = {
+	title: string;
+	columns: string[];
+	fetchPage: (page: number, pageSize: number) => Promise<Paginated<T>>;
+	renderRow: (item: T) => React.ReactNode[];
+	emptyMessage: string;
+	// Changing the filter starts again from the first page
+	filter?: string;
+	toolbar?: React.ReactNode;
+};
+
+export default function SurveyPagedTable<T>({
+	title,
+	columns,
+	fetchPage,
+	renderRow,
+	emptyMessage,
+	filter,
+	toolbar,
+}: SurveyPagedTableProps<T>) {
+	const [page, setPage] = useState(1);
+	const [data, setData] = useState<Paginated<T> | null>(null);
+	const [loading, setLoading] = useState(true);
+
+	useEffect(() => {
+		setPage(1);
+	}, [filter]);
+
+	useEffect(() => {
+		let cancelled = false;
+		setLoading(true);
+		fetchPage(page, PAGE_SIZE)
+			.then((result) => {
+				if (!cancelled) setData(result);
+			})
+			.finally(() => {
+				if (!cancelled) setLoading(false);
+			});
+		return () => {
+			cancelled = true;
+		};
+		// fetchPage is recreated on every render, the filter stands in for it
+		// eslint-disable-next-line react-hooks/exhaustive-deps
+	}, [page, filter]);
+
+	const totalPages = data ? Math.max(1, Math.ceil(data.total / PAGE_SIZE)) : 1;
+
+	return (
+		<section className="mt-8">
+			<div className="flex items-center justify-between mb-2">
+				<h2 className="text-xl font-semibold">
+					{title}
+					{data && (
+						<span className="ml-2 text-sm font-normal text-gray-500">
+							({data.total.toLocaleString()})
+						</span>
+					)}
+				</h2>
+				{toolbar}
+			</div>
+			{loading && !data ? (
+				<div className="flex justify-center py-6">
+					<Loading />
+				</div>
+			) : !data || data.items.length === 0 ? (
+				<div className="py-6 text-center text-gray-400">{emptyMessage}</div>
+			) : (
+				<div className="overflow-x-auto">
+					<table className="w-full text-left border bg-white">
+						<thead>
+							<tr className="bg-gray-100">
+								{columns.map((column) => (
+									<th key={column} className="p-2">
+										{column}
+									</th>
+								))}
+							</tr>
+						</thead>
+						<tbody className={loading ? "opacity-50" : undefined}>
+							{data.items.map((item, idx) => (
+								<tr key={idx} className="border-t">
+									{renderRow(item).map((cell, cellIdx) => (
+										<td key={cellIdx} className="p-2">
+											{cell}
+										</td>
+									))}
+								</tr>
+							))}
+						</tbody>
+					</table>
+				</div>
+			)}
+			{totalPages > 1 && (
+				<div className="mt-4">
+					<Pagination
+						currentPage={page}
+						totalPages={totalPages}
+						onPageChange={setPage}
+					/>
+				</div>
+			)}
+		</section>
+	);
+}
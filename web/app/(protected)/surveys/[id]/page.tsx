@@ -2,10 +2,16 @@
 
 import { useParams } from "next/navigation";
 import { useEffect, useState } from "react";
-import { Survey, SurveyResultResponse } from "../../../_lib/models";
+import {
+	EmailTaskInfo,
+	EmailTaskStatus,
+	SurveyDetail,
+	SurveyResultResponse,
+} from "../../../_lib/models";
 import SurveyService from "../../../_lib/survey";
 import SurveyDetails from "./SurveyDetails";
 import SurveyResultsTable from "./SurveyResultsTable";
+import SurveyPagedTable from "./SurveyPagedTable";
 import Loading from "../../../_components/Loading";
 import Action from "../../../_components/Action";
 import Input from "../../../_components/Input";
@@ -22,17 +28,42 @@ export default function SurveyDetailPage() {
 	const id = params.id;
 	const { isSurveyServiceHealthy } = useHealth();
 
-	const [survey, setSurvey] = useState<Survey | null>(null);
+	const [survey, setSurvey] = useState<SurveyDetail | null>(null);
 	const [results, setResults] = useState<SurveyResultResponse | null>(null);
+	const [responses, setResponses] = useState<SurveyResultResponse["responses"]>(
+		[],
+	);
+	const [loadingMore, setLoadingMore] = useState(false);
+	const [emailTaskStatus, setEmailTaskStatus] = useState<EmailTaskStatus | "">(
+		"",
+	);
 	const [dataLoading, setDataLoading] = useState(true);
 	const [copied, setCopied] = useState(false);
 
 	useEffect(() => {
 		SurveyService.getSurvey(id).then((data) => setSurvey(data));
-		SurveyService.getSurveyResults(id).then((data) => setResults(data));
+		SurveyService.getSurveyResults(id).then((data) => {
+			setResults(data);
+			setResponses(data.responses);
+		});
 		setDataLoading(false);
 	}, [id]);
 
+	const handleLoadMore = async () => {
+		if (!results?.nextCursor) return;
+		setLoadingMore(true);
+		try {
+			const data = await SurveyService.getSurveyResults(id, {
+				cursor: results.nextCursor,
+				pageSize: results.pageSize,
+			});
+			setResults(data);
+			setResponses((previous) => [...previous, ...data.responses]);
+		} finally {
+			setLoadingMore(false);
+		}
+	};
+
 	let chartData: { name: string; count: number }[] = [];
 	let hasResponses = false;
 
@@ -51,17 +82,7 @@ export default function SurveyDetailPage() {
 		}
 	}
 
-	let dailyCounts: { date: string; count: number }[] = [];
-	if (results && results.responses) {
-		const counts: Record<string, number> = {};
-		results.responses.forEach((resp) => {
-			const date = new Date(resp.answeredAt).toISOString().slice(0, 10);
-			counts[date] = (counts[date] || 0) + 1;
-		});
-		dailyCounts = Object.entries(counts)
-			.map(([date, count]) => ({ date, count }))
-			.sort((a, b) => a.date.localeCompare(b.date));
-	}
+	const dailyCounts = results?.dailyCounts ?? [];
 
 	if (dataLoading || !survey || !results) {
 		return (
@@ -138,9 +159,82 @@ export default function SurveyDetailPage() {
 				<>
 					<SurveyPieChart chartData={chartData} />
 					<SurveyDailyChart dailyCounts={dailyCounts} />
-					<SurveyResultsTable responses={results.responses} />
+					<SurveyResultsTable responses={responses} />
+					{results.nextCursor && (
+						<div className="flex justify-center mt-4">
+							<Action
+								type="button"
+								variant="secondary"
+								size="md"
+								onClick={handleLoadMore}
+								disabled={loadingMore}
+							>
+								{loadingMore ? "Loading..." : "Load more responses"}
+							</Action>
+						</div>
+					)}
 				</>
 			)}
+
+			<SurveyPagedTable<EmailTaskInfo>
+				title="Email delivery"
+				columns={["Recipient", "Status", "Attempts", "Sent at", "Last error"]}
+				fetchPage={(page, pageSize) =>
+					SurveyService.getSurveyEmailTasks(id, {
+						status: emailTaskStatus || undefined,
+						page,
+						pageSize,
+					})
+				}
+				renderRow={(task) => [
+					task.recipient,
+					task.status,
+					task.attempts,
+					task.sentAt ? new Date(task.sentAt).toLocaleString() : "-",
+					<span key="error" className="text-xs text-gray-500">
+						{task.lastError ?? "-"}
+					</span>,
+				]}
+				emptyMessage="No emails"
+				filter={emailTaskStatus}
+				toolbar={
+					<select
+						aria-label="Email status"
+						className="border px-2 py-1 text-sm bg-white"
+						value={emailTaskStatus}
+						onChange={(e) =>
+							setEmailTaskStatus(e.target.value as EmailTaskStatus | "")
+						}
+					>
+						<option value="">All</option>
+						<option value="PENDING">Pending</option>
+						<option value="SENT">Sent</option>
+						<option value="FAILED">Failed</option>
+					</select>
+				}
+			/>
+
+			<SurveyPagedTable<string>
+				title="Recipients"
+				columns={["Email"]}
+				fetchPage={(page, pageSize) =>
+					SurveyService.getSurveyRecipients(id, { page, pageSize })
+				}
+				renderRow={(email) => [email]}
+				emptyMessage="No recipients"
+			/>
+
+			{!survey.isAnonymous && (
+				<SurveyPagedTable<string>
+					title="Respondents"
+					columns={["Email"]}
+					fetchPage={(page, pageSize) =>
+						SurveyService.getSurveyRespondents(id, { page, pageSize })
+					}
+					renderRow={(email) => [email]}
+					emptyMessage="No respondents yet"
+				/>
+			)}
 		</div>
 	);
 }
@@ -13,6 +13,8 @@ import { TOAST_TYPES, useToast } from "../../../_context/ToastContext";
 import { useHealth } from "../../../_context/HealthContext";
 import { SERVICE_TYPES } from "../../../_lib/health";
 
+const MAX_RECIPIENTS = 50000;
+
 type FormValues = {
 	name: string;
 	question: string;
@@ -64,8 +66,8 @@ export default function CreateSurveyForm({
 			}
 			if (values.recipients.length === 0) {
 				errors.recipients = "At least one recipient is required";
-			} else if (values.recipients.length > 50) {
-				errors.recipients = "Maximum 50 recipients are allowed";
+			} else if (values.recipients.length > MAX_RECIPIENTS) {
+				errors.recipients = `Maximum ${MAX_RECIPIENTS.toLocaleString()} recipients are allowed`;
 			}
 			return errors;
 		},
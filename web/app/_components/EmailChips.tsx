@@ -40,7 +40,8 @@ export default function EmailChips({
 		}
 	};
 
-	const addEmail = (email: string) => {
+	const addEmail = (rawEmail: string) => {
+		const email = rawEmail.toLowerCase();
 		if (!validateEmail(email)) {
 			setInputError("Invalid email");
 			return;
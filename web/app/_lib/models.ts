@@ -41,14 +41,22 @@ export type Survey = {
 	question: string;
 	endDate: string;
 	isAnonymous: boolean;
-	recipients: string[];
+	recipientCount: number;
 	status: SurveyStatusType;
 	createdAt: string;
 	updatedAt: string;
 	results: Record<SurveyAnswerType, number>;
-	respondentEmails?: string[] | null;
-	emailStatus?: EmailTaskInfo[]; // for detail
-	emailStatusSummary?: EmailStatusSummary; // for list
+	totalResponses: number;
+	emailStatusSummary: EmailStatusSummary;
+};
+
+export type SurveyDetail = Survey;
+
+export type Paginated<T> = {
+	items: T[];
+	total: number;
+	page: number;
+	pageSize: number;
 };
 
 export type CreateSurveyRequest = {
@@ -59,7 +67,13 @@ export type CreateSurveyRequest = {
 	recipients: string[];
 };
 
-export type CreateSurveyResponse = Survey;
+export type CreateSurveyResponse = Omit<
+	Survey,
+	"recipientCount" | "results" | "totalResponses" | "emailStatusSummary"
+> & {
+	recipients: string[];
+	contactListId?: string | null;
+};
 
 export type PublicSurvey = {
 	id: string;
@@ -98,11 +112,14 @@ export type SurveyResultResponse = {
 	surveyId: string;
 	results: Record<SurveyAnswerType, number>;
 	totalResponses: number;
+	dailyCounts: { date: string; count: number }[];
 	responses: {
 		respondentEmail: string | null;
 		answer: SurveyAnswerType;
 		answeredAt: string;
 	}[];
+	nextCursor: string | null;
+	pageSize: number;
 };
 
 export type EmailTaskStatus = "PENDING" | "SENT" | "FAILED";
@@ -111,6 +128,9 @@ export type EmailTaskInfo = {
 	recipient: string;
 	status: EmailTaskStatus;
 	sentAt: string | null;
+	attempts: number;
+	nextAttemptAt: string | null;
+	lastError: string | null;
 };
 
 export type EmailStatusSummary = {
@@ -1,6 +1,10 @@
 import { surveyApiClient, withHealthCheck } from "./apiClient";
 import {
 	Survey,
+	SurveyDetail,
+	Paginated,
+	EmailTaskInfo,
+	EmailTaskStatus,
 	CreateSurveyRequest,
 	CreateSurveyResponse,
 	SurveyResultResponse,
@@ -57,17 +61,78 @@ export const SurveyService = {
 		);
 	},
 
-	getSurvey: async (id: string): Promise<Survey> => {
+	getSurvey: async (id: string): Promise<SurveyDetail> => {
 		return withHealthCheck(
-			() => surveyApiClient.get<Survey>(`/api/surveys/${id}`),
+			() => surveyApiClient.get<SurveyDetail>(`/api/surveys/${id}`),
 			SERVICE_TYPES.SURVEY,
 		);
 	},
 
-	getSurveyResults: async (id: string): Promise<SurveyResultResponse> => {
+	getSurveyRecipients: async (
+		id: string,
+		{ page = 1, pageSize = 20 }: { page?: number; pageSize?: number } = {},
+	): Promise<Paginated<string>> => {
 		return withHealthCheck(
 			() =>
-				surveyApiClient.get<SurveyResultResponse>(`/api/surveys/${id}/results`),
+				surveyApiClient.get<Paginated<string>>(
+					`/api/surveys/${id}/recipients`,
+					{ page, pageSize },
+				),
+			SERVICE_TYPES.SURVEY,
+		);
+	},
+
+	getSurveyEmailTasks: async (
+		id: string,
+		{
+			status,
+			page = 1,
+			pageSize = 20,
+		}: { status?: EmailTaskStatus; page?: number; pageSize?: number } = {},
+	): Promise<Paginated<EmailTaskInfo>> => {
+		const params: Record<string, string | number | boolean> = {
+			page,
+			pageSize,
+		};
+		if (status) params.status = status;
+
+		return withHealthCheck(
+			() =>
+				surveyApiClient.get<Paginated<EmailTaskInfo>>(
+					`/api/surveys/${id}/email-tasks`,
+					params,
+				),
+			SERVICE_TYPES.SURVEY,
+		);
+	},
+
+	getSurveyRespondents: async (
+		id: string,
+		{ page = 1, pageSize = 20 }: { page?: number; pageSize?: number } = {},
+	): Promise<Paginated<string>> => {
+		return withHealthCheck(
+			() =>
+				surveyApiClient.get<Paginated<string>>(
+					`/api/surveys/${id}/respondents`,
+					{ page, pageSize },
+				),
+			SERVICE_TYPES.SURVEY,
+		);
+	},
+
+	getSurveyResults: async (
+		id: string,
+		{ cursor, pageSize = 20 }: { cursor?: string; pageSize?: number } = {},
+	): Promise<SurveyResultResponse> => {
+		const params: Record<string, string | number | boolean> = { pageSize };
+		if (cursor) params.cursor = cursor;
+
+		return withHealthCheck(
+			() =>
+				surveyApiClient.get<SurveyResultResponse>(
+					`/api/surveys/${id}/results`,
+					params,
+				),
 			SERVICE_TYPES.SURVEY,
 		);
 	},